@@ -11,7 +11,9 @@ from typing import List, Optional, Dict, Any
 import uvicorn
 import os
 import sys
+import time
 import logging
+from functools import lru_cache
 from pathlib import Path
 
 # Add project root to path for shared module imports
@@ -79,8 +81,9 @@ app.add_middleware(
 # =============================================================================
 
 try:
-    from anthropic import Anthropic
-    anthropic_client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+    from anthropic import AsyncAnthropic
+    # Async client so /chat awaits the model without blocking the event loop
+    anthropic_client = AsyncAnthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
     logger.info("Anthropic client initialized")
 except Exception as e:
     anthropic_client = None
@@ -96,6 +99,22 @@ SAMPLE_DIR = DATA_DIR / "sample"
 PROCESSED_DIR = DATA_DIR / "processed"
 SCHEMAS_DIR = DATA_DIR / "schemas"
 
+# Directory scans for /health and /api/pipeline/status are cached briefly so
+# frequent liveness probes don't re-list the data directories on every call.
+FILE_COUNT_TTL_SECONDS = 5
+
+
+@lru_cache(maxsize=8)
+def _count_csv_files_cached(directory: Path, _bucket: int) -> int:
+    if not directory.exists():
+        return 0
+    return sum(1 for _ in directory.glob("*.csv"))
+
+
+def _count_csv_files(directory: Path) -> int:
+    """Number of CSVs in ``directory``, refreshed at most every TTL window."""
+    return _count_csv_files_cached(directory, int(time.monotonic() // FILE_COUNT_TTL_SECONDS))
+
 # =============================================================================
 # DATA LOADER + DATA ROUTES
 # =============================================================================
@@ -155,7 +174,7 @@ async def health_check():
         "raw_dir_exists": RAW_DIR.exists(),
         "sample_dir_exists": SAMPLE_DIR.exists(),
         "processed_dir_exists": PROCESSED_DIR.exists(),
-        "sample_files": len(list(SAMPLE_DIR.glob("*.csv"))) if SAMPLE_DIR.exists() else 0,
+        "sample_files": _count_csv_files(SAMPLE_DIR),
     }
     return HealthResponse(
         status="healthy",
@@ -173,9 +192,9 @@ async def health_check():
 async def pipeline_status():
     """Check the status of the data pipeline."""
     return PipelineStatusResponse(
-        raw_files=len(list(RAW_DIR.glob("*.csv"))) if RAW_DIR.exists() else 0,
-        processed_files=len(list(PROCESSED_DIR.glob("*.csv"))) if PROCESSED_DIR.exists() else 0,
-        sample_files=len(list(SAMPLE_DIR.glob("*.csv"))) if SAMPLE_DIR.exists() else 0,
+        raw_files=_count_csv_files(RAW_DIR),
+        processed_files=_count_csv_files(PROCESSED_DIR),
+        sample_files=_count_csv_files(SAMPLE_DIR),
     )
 
 # =============================================================================
@@ -195,6 +214,14 @@ You speak in the language of broadcast TV sales: dayparts, AUR, sell-out rates,
 Be specific with numbers when data is available. Flag data gaps honestly.
 Never fabricate data points — if you don't have the data, say so."""
 
+# System prompt as a content block with a cache breakpoint. Anthropic only caches
+# prefixes above a minimum length (1024 tokens for Sonnet); this prompt alone is
+# ~200 tokens, so the breakpoint is a no-op until tool definitions or data
+# context push the cached prefix past that minimum.
+SYSTEM_BLOCKS = [
+    {"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}},
+]
+
 @app.post("/chat", response_model=ChatResponse, tags=["chat"])
 @limiter.limit("60/minute")
 async def chat(request: Request, chat_request: ChatRequest):
@@ -206,10 +233,10 @@ async def chat(request: Request, chat_request: ChatRequest):
                 messages.append({"role": msg.role, "content": msg.content})
             messages.append({"role": "user", "content": chat_request.message})
 
-            response = anthropic_client.messages.create(
+            response = await anthropic_client.messages.create(
                 model=os.getenv("CLAUDE_MODEL", "claude-sonnet-4-20250514"),
                 max_tokens=4096,
-                system=SYSTEM_PROMPT,
+                system=SYSTEM_BLOCKS,
                 messages=messages,
             )
 
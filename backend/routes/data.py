@@ -3,12 +3,18 @@ Data API routes — six endpoints serving aggregated WideOrbit analytics.
 
 All revenue calculations filter on status in ('aired', 'makegood').
 CY = 2025, PY = 2024.
+
+The source data is immutable for the lifetime of the process, so each
+endpoint's result is memoized per query-parameter combination. Callers must
+treat returned dicts as read-only; call clear_caches() after a data reload.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from fastapi import APIRouter, Query
-from services.data_loader import DataLoader, DAYPART_NAMES, DAYPART_ORDER
+from services.data_loader import DataLoader, DAYPART_NAMES, DAYPART_ORDER, REVENUE_STATUSES
 
 router = APIRouter(prefix="/api/data", tags=["data"])
 
@@ -19,6 +25,7 @@ def init_loader(loader: DataLoader) -> None:
     """Called once from main.py to inject the shared DataLoader."""
     global _loader
     _loader = loader
+    clear_caches()
 
 
 def _get_loader() -> DataLoader:
@@ -26,13 +33,19 @@ def _get_loader() -> DataLoader:
     return _loader
 
 
+def clear_caches() -> None:
+    """Drop memoized endpoint results, e.g. after the loader's data changes."""
+    for fn in _CACHED:
+        fn.cache_clear()
+
+
 # ── helpers ──────────────────────────────────────────────────────────────────
 
+import numpy as np
 import pandas as pd
 
 CY_YEAR = 2025
 PY_YEAR = 2024
-REVENUE_STATUSES = ["aired", "makegood"]
 
 
 def _ytd_cutoff(spots: pd.DataFrame) -> int:
@@ -41,13 +54,51 @@ def _ytd_cutoff(spots: pd.DataFrame) -> int:
     Used to clip PY to the same calendar window so YoY comparisons
     are apples-to-apples (e.g. Jan 1–Feb 15 vs Jan 1–Feb 15).
     """
-    cy_aired = spots[
-        (spots["air_date"].dt.year == CY_YEAR)
-        & spots["status"].isin(REVENUE_STATUSES)
-    ]
+    cy_aired = spots[(spots["year"] == CY_YEAR) & spots["is_revenue"]]
     if cy_aired.empty:
         return 366  # no CY data → don't clip PY
-    return int(cy_aired["air_date"].dt.dayofyear.max())
+    return int(cy_aired["doy"].max())
+
+
+def _daypart_year_sums(
+    daypart: np.ndarray,
+    year: np.ndarray,
+    mask: np.ndarray,
+    weights: np.ndarray,
+) -> np.ndarray:
+    """Sum ``weights`` per daypart x {PY, CY} in a single bincount pass.
+
+    Returns a (len(DAYPART_ORDER), 2) array with columns [PY, CY]; rows
+    follow DAYPART_ORDER (daypart codes are DAYPART_ORDER indices).
+    """
+    n_dp = len(DAYPART_ORDER)
+    m = mask & (daypart >= 0) & ((year == CY_YEAR) | (year == PY_YEAR))
+    idx = daypart[m].astype(np.int64) * 2 + (year[m] == CY_YEAR)
+    sums = np.bincount(idx, weights=weights[m], minlength=2 * n_dp)
+    # bincount returns int64 when idx is empty, even with weights
+    return sums[: 2 * n_dp].astype(np.float64, copy=False).reshape(n_dp, 2)
+
+
+def _status_tally(spots: pd.DataFrame, key: str, index: list) -> pd.DataFrame:
+    """Preempted / makegood / countable spot counts and preempted revenue per ``key``.
+
+    One crosstab pass over the frame; rows follow ``index``, missing → 0.
+    Countable spots are aired + makegood + preempted.
+    """
+    ct = pd.crosstab(spots[key], spots["status"]).reindex(
+        index=index, columns=["aired", "makegood", "preempted"], fill_value=0
+    )
+    impact = (
+        spots[spots["is_preempted"]]
+        .groupby(key, observed=True)["rate"].sum()
+        .reindex(index, fill_value=0.0)
+    )
+    return pd.DataFrame({
+        "preempted": ct["preempted"].to_numpy(),
+        "makegood": ct["makegood"].to_numpy(),
+        "total": ct.sum(axis=1).to_numpy(),
+        "revenue_impact": impact.to_numpy(),
+    })
 
 
 # ── GET /stations ────────────────────────────────────────────────────────────
@@ -62,30 +113,24 @@ async def get_stations():
 
 @router.get("/revenue-by-daypart")
 async def revenue_by_daypart(station: str | None = Query(default=None)):
-    loader = _get_loader()
-    spots = loader.spots
+    return _revenue_by_daypart(station)
 
-    rev = spots[spots["status"].isin(REVENUE_STATUSES)].copy()
-    if station:
-        rev = rev[rev["station"] == station]
 
-    # YTD comparison: clip PY to same calendar window as CY
-    cutoff_doy = _ytd_cutoff(spots)
-    rev["year"] = rev["air_date"].dt.year
-    rev["doy"] = rev["air_date"].dt.dayofyear
-    cy = rev[(rev["year"] == CY_YEAR) & (rev["doy"] <= cutoff_doy)]
-    py = rev[(rev["year"] == PY_YEAR) & (rev["doy"] <= cutoff_doy)]
+@lru_cache(maxsize=128)
+def _revenue_by_daypart(station: str | None) -> dict:
+    loader = _get_loader()
+    arrays = loader.spot_arrays
 
-    cy_by_dp = cy.groupby("daypart")["rate"].sum()
-    py_by_dp = py.groupby("daypart")["rate"].sum()
+    # YTD comparison: clip PY to same calendar window as CY
+    cutoff_doy = _ytd_cutoff(loader.revenue_spots)
+    mask = loader.mask_revenue_station(station) & (arrays.doy <= cutoff_doy)
+    rev_by_dp = _daypart_year_sums(arrays.daypart, arrays.year, mask, arrays.rate)
 
-    total_cy = float(cy["rate"].sum())
-    total_py = float(py["rate"].sum())
+    total_cy = float(arrays.rate[mask & (arrays.year == CY_YEAR)].sum())
+    total_py = float(arrays.rate[mask & (arrays.year == PY_YEAR)].sum())
 
     dayparts = []
-    for dp in DAYPART_ORDER:
-        cy_r = float(cy_by_dp.get(dp, 0))
-        py_r = float(py_by_dp.get(dp, 0))
+    for dp, (py_r, cy_r) in zip(DAYPART_ORDER, rev_by_dp.tolist()):
         yoy = ((cy_r - py_r) / py_r * 100) if py_r > 0 else 0.0
         share = (cy_r / total_cy * 100) if total_cy > 0 else 0.0
         dayparts.append({
@@ -114,30 +159,27 @@ async def aur_trends(
     station: str | None = Query(default=None),
     granularity: str = Query(default="monthly"),
 ):
+    return _aur_trends(station, granularity)
+
+
+@lru_cache(maxsize=128)
+def _aur_trends(station: str | None, granularity: str) -> dict:
     loader = _get_loader()
-    spots = loader.spots
 
-    rev = spots[spots["status"].isin(REVENUE_STATUSES)].copy()
-    if station:
-        rev = rev[rev["station"] == station]
-
-    if granularity == "quarterly":
-        rev["period"] = rev["air_date"].dt.to_period("Q").astype(str)
-    else:
-        rev["period"] = rev["air_date"].dt.to_period("M").astype(str)
-
-    grouped = rev.groupby(["period", "daypart"])["rate"].mean()
-    periods = sorted(rev["period"].unique().tolist())
-
-    series: dict[str, list[float | None]] = {}
-    for dp in DAYPART_ORDER:
-        values: list[float | None] = []
-        for p in periods:
-            try:
-                values.append(round(float(grouped.loc[(p, dp)]), 2))
-            except KeyError:
-                values.append(None)
-        series[dp] = values
+    rev = loader.revenue_spots_for_station(station)
+
+    period_col = "quarter_period" if granularity == "quarterly" else "month_period"
+    periods = sorted(rev[period_col].unique().tolist())
+    pivot = (
+        rev.groupby([period_col, "daypart"], observed=True)["rate"].mean()
+        .unstack("daypart")
+        .reindex(index=periods, columns=DAYPART_ORDER)
+    )
+
+    series: dict[str, list[float | None]] = {
+        dp: [None if pd.isna(v) else round(float(v), 2) for v in pivot[dp].to_numpy()]
+        for dp in DAYPART_ORDER
+    }
 
     return {"periods": periods, "series": series}
 
@@ -149,21 +191,17 @@ async def top_advertisers(
     station: str | None = Query(default=None),
     limit: int = Query(default=10, ge=1, le=50),
 ):
-    loader = _get_loader()
-    spots = loader.spots
-    orders = loader.orders
+    return _top_advertisers(station, limit)
 
-    rev = spots[spots["status"].isin(REVENUE_STATUSES)].copy()
-    if station:
-        rev = rev[rev["station"] == station]
 
-    merged = rev.merge(
-        orders[["order_id", "advertiser_name"]],
-        on="order_id",
-        how="left",
-    )
+@lru_cache(maxsize=128)
+def _top_advertisers(station: str | None, limit: int) -> dict:
+    loader = _get_loader()
+
+    rev = loader.revenue_spots_for_station(station)
+    advertiser = rev["order_id"].map(loader.advertiser_by_order)
 
-    by_adv = merged.groupby("advertiser_name")["rate"].sum().sort_values(ascending=False)
+    by_adv = rev["rate"].groupby(advertiser.to_numpy()).sum().sort_values(ascending=False)
     total_rev = float(by_adv.sum())
 
     top = by_adv.head(limit)
@@ -197,28 +235,24 @@ async def top_advertisers(
 
 @router.get("/sellout-rates")
 async def sellout_rates(station: str | None = Query(default=None)):
+    return _sellout_rates(station)
+
+
+@lru_cache(maxsize=128)
+def _sellout_rates(station: str | None) -> dict:
     loader = _get_loader()
-    inv = loader.inventory.copy()
-    if station:
-        inv = inv[inv["station"] == station]
+    inv = loader.inventory_arrays
 
     # YTD comparison: clip PY to same calendar window as CY
-    cutoff_doy = _ytd_cutoff(loader.spots)
-    inv["year"] = inv["date"].dt.year
-    inv["doy"] = inv["date"].dt.dayofyear
-    cy = inv[(inv["year"] == CY_YEAR) & (inv["doy"] <= cutoff_doy)]
-    py = inv[(inv["year"] == PY_YEAR) & (inv["doy"] <= cutoff_doy)]
-
-    cy_by_dp = cy.groupby("daypart").agg(booked=("booked", "sum"), avails=("total_avails", "sum"))
-    py_by_dp = py.groupby("daypart").agg(booked=("booked", "sum"), avails=("total_avails", "sum"))
+    cutoff_doy = _ytd_cutoff(loader.revenue_spots)
+    mask = loader.mask_inventory_station(station) & (inv.doy <= cutoff_doy)
+    booked_by_dp = _daypart_year_sums(inv.daypart, inv.year, mask, inv.booked)
+    avails_by_dp = _daypart_year_sums(inv.daypart, inv.year, mask, inv.total_avails)
 
     dayparts = []
-    for dp in DAYPART_ORDER:
-        cy_avails = float(cy_by_dp.loc[dp, "avails"]) if dp in cy_by_dp.index else 0
-        cy_booked = float(cy_by_dp.loc[dp, "booked"]) if dp in cy_by_dp.index else 0
-        py_avails = float(py_by_dp.loc[dp, "avails"]) if dp in py_by_dp.index else 0
-        py_booked = float(py_by_dp.loc[dp, "booked"]) if dp in py_by_dp.index else 0
-
+    for dp, (py_booked, cy_booked), (py_avails, cy_avails) in zip(
+        DAYPART_ORDER, booked_by_dp.tolist(), avails_by_dp.tolist()
+    ):
         cy_rate = (cy_booked / cy_avails * 100) if cy_avails > 0 else 0.0
         py_rate = (py_booked / py_avails * 100) if py_avails > 0 else 0.0
 
@@ -237,65 +271,64 @@ async def sellout_rates(station: str | None = Query(default=None)):
 
 @router.get("/makegood-summary")
 async def makegood_summary(station: str | None = Query(default=None)):
+    return _makegood_summary(station)
+
+
+@lru_cache(maxsize=128)
+def _makegood_summary(station: str | None) -> dict:
     loader = _get_loader()
-    spots = loader.spots.copy()
+    spots = loader.spots_for_station(station)
+    stations = list(loader.stations)
     if station:
-        spots = spots[spots["station"] == station]
+        stations = [st for st in stations if st == station]
 
-    countable = ["aired", "makegood", "preempted"]
+    by_station = _status_tally(spots, "station", stations)
+    by_daypart = _status_tally(spots, "daypart", DAYPART_ORDER)
 
     # ── by station ───────────────────────────────────────────────────────
     station_rows = []
-    for st in sorted(spots["station"].unique()):
-        st_spots = spots[spots["station"] == st]
-        relevant = st_spots[st_spots["status"].isin(countable)]
-        total = len(relevant)
-        preempted = int((relevant["status"] == "preempted").sum())
-        makegood = int((relevant["status"] == "makegood").sum())
-
-        preemption_rate = (preempted / total * 100) if total > 0 else 0.0
-        makegood_rate = (makegood / total * 100) if total > 0 else 0.0
+    for st, row in zip(stations, by_station.itertuples(index=False)):
+        total = int(row.total)
+        preemption_rate = (row.preempted / total * 100) if total > 0 else 0.0
+        makegood_rate = (row.makegood / total * 100) if total > 0 else 0.0
         combined_rate = preemption_rate + makegood_rate
 
-        revenue_impact = float(
-            st_spots[st_spots["status"] == "preempted"]["rate"].sum()
-        )
-
         station_rows.append({
             "station": st,
-            "preempted": preempted,
-            "makegood": makegood,
+            "preempted": int(row.preempted),
+            "makegood": int(row.makegood),
             "total_spots": total,
             "preemption_rate": round(preemption_rate, 1),
             "makegood_rate": round(makegood_rate, 1),
             "combined_rate": round(combined_rate, 1),
-            "revenue_impact": round(revenue_impact, 2),
+            "revenue_impact": round(float(row.revenue_impact), 2),
             "flag": combined_rate > 5,
         })
 
     # ── by daypart ───────────────────────────────────────────────────────
     daypart_rows = []
-    for dp in DAYPART_ORDER:
-        dp_spots = spots[spots["daypart"] == dp]
-        relevant = dp_spots[dp_spots["status"].isin(countable)]
-        total = len(relevant)
-        preempted = int((relevant["status"] == "preempted").sum())
-        makegood = int((relevant["status"] == "makegood").sum())
-
-        combined_rate = ((preempted + makegood) / total * 100) if total > 0 else 0.0
-        revenue_impact = float(
-            dp_spots[dp_spots["status"] == "preempted"]["rate"].sum()
-        )
+    for dp, row in zip(DAYPART_ORDER, by_daypart.itertuples(index=False)):
+        total = int(row.total)
+        combined_rate = ((row.preempted + row.makegood) / total * 100) if total > 0 else 0.0
 
         daypart_rows.append({
             "daypart": dp,
             "daypart_name": DAYPART_NAMES[dp],
-            "preempted": preempted,
-            "makegood": makegood,
+            "preempted": int(row.preempted),
+            "makegood": int(row.makegood),
             "total_spots": total,
             "combined_rate": round(combined_rate, 1),
-            "revenue_impact": round(revenue_impact, 2),
+            "revenue_impact": round(float(row.revenue_impact), 2),
             "flag": combined_rate > 5,
         })
 
     return {"stations": station_rows, "by_daypart": daypart_rows}
+
+
+_CACHED = (
+    _revenue_by_daypart,
+    _aur_trends,
+    _top_advertisers,
+    _sellout_rates,
+    _makegood_summary,
+)
@@ -1,15 +1,25 @@
 """
 DataLoader — lazy-loading service for WideOrbit sample CSVs.
 
-Reads orders.csv, spots.csv, inventory.csv on first access, then caches
-the resulting DataFrames for the lifetime of the process.
+Reads orders.csv, spots.csv, inventory.csv on first access (multi-threaded
+PyArrow CSV parser with explicit column types), then caches the resulting
+DataFrames for the lifetime of the process. Date parts and
+status flags the routes filter on (year, day-of-year, month/quarter period,
+is_revenue, ...) are derived once at load time.
+
+Flat NumPy arrays of the hot spot columns (``spot_arrays``) are kept
+alongside the DataFrame so handlers can mask and reduce without pandas
+indexing overhead.
 """
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from pathlib import Path
-from typing import List
+from typing import List, NamedTuple
 
 
 DAYPART_NAMES = {
@@ -25,6 +35,126 @@ DAYPART_NAMES = {
 
 DAYPART_ORDER = ["EM", "DT", "EF", "EN", "PA", "PR", "LN", "LF"]
 
+# Statuses that count toward booked revenue
+REVENUE_STATUSES = ["aired", "makegood"]
+
+# Known spot statuses (wo_fields.yaml); unexpected values are appended
+STATUS_ORDER = ["aired", "makegood", "preempted", "scheduled"]
+
+
+# Arrow types for CSV parsing. Dictionary-encoded strings arrive in pandas
+# as Categorical; the CSV reader only supports int32 dictionary indices.
+_DATE = pa.timestamp("s")
+_DICT = pa.dictionary(pa.int32(), pa.string())
+
+ORDERS_COLUMN_TYPES = {
+    "order_date": _DATE,
+    "start_date": _DATE,
+    "end_date": _DATE,
+    "order_total": pa.float64(),
+}
+SPOTS_COLUMN_TYPES = {
+    "air_date": _DATE,
+    "air_time": pa.string(),
+    "daypart": _DICT,
+    "length": pa.int64(),
+    "rate": pa.float64(),
+    "status": _DICT,
+    "station": _DICT,
+}
+INVENTORY_COLUMN_TYPES = {
+    "date": _DATE,
+    "daypart": _DICT,
+    "station": _DICT,
+    "total_avails": pa.int64(),
+    "booked": pa.int64(),
+    "remaining": pa.int64(),
+}
+
+
+def _read_csv(path: Path, column_types: dict) -> pd.DataFrame:
+    """Parse a CSV with PyArrow's threaded reader and convert to pandas."""
+    table = pacsv.read_csv(
+        path,
+        convert_options=pacsv.ConvertOptions(column_types=column_types),
+    )
+    return table.to_pandas()
+
+
+def _as_category(values: pd.Series, known: List[str] | None = None) -> pd.Series:
+    """Cast a string column to Categorical with ``known`` codes first.
+
+    Values outside ``known`` are kept as extra categories rather than
+    silently becoming NaN.
+    """
+    known = known or []
+    extra = sorted(set(values.dropna().unique()) - set(known))
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # astype() treats unordered dtypes with the same categories as equal
+        # and would keep the reader's appearance order; recode explicitly.
+        return values.cat.set_categories(known + extra)
+    return values.astype(pd.CategoricalDtype(known + extra))
+
+
+class SpotArrays(NamedTuple):
+    """Column-per-array (SoA) view of the spots frame.
+
+    Every array is C-contiguous so masked gathers and reductions walk
+    sequential memory. Categorical columns are stored as their codes; because known values are
+    listed first, ``daypart == i`` means ``DAYPART_ORDER[i]``. Rate stays
+    float64 so currency sums over many spots keep cent precision.
+    """
+
+    status: np.ndarray      # int8 codes into STATUS_ORDER (+ extras)
+    daypart: np.ndarray     # int8 codes into DAYPART_ORDER (+ extras), -1 = missing
+    station: np.ndarray     # int8 codes into station categories
+    rate: np.ndarray        # float64
+    year: np.ndarray        # int16
+    doy: np.ndarray         # int16
+    is_revenue: np.ndarray  # bool
+
+
+class InventoryArrays(NamedTuple):
+    """Column-per-array (SoA) view of the inventory frame."""
+
+    daypart: np.ndarray       # int8 codes into DAYPART_ORDER (+ extras), -1 = missing
+    station: np.ndarray       # int8 codes into station categories
+    booked: np.ndarray        # int64
+    total_avails: np.ndarray  # int64
+    year: np.ndarray          # int16
+    doy: np.ndarray           # int16
+
+
+def _contiguous(values: pd.Series, dtype=None) -> np.ndarray:
+    """Column as a C-contiguous NumPy array (pandas may hand back strided views)."""
+    arr = np.ascontiguousarray(values.to_numpy(), dtype=dtype)
+    assert arr.flags["C_CONTIGUOUS"]
+    return arr
+
+
+def _split_by_station(frame: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """Partition ``frame`` into one contiguous sub-frame per station."""
+    return {
+        st: grp.reset_index(drop=True)
+        for st, grp in frame.groupby("station", sort=False, observed=True)
+    }
+
+
+def _for_station(
+    frame: pd.DataFrame, by_station: dict[str, pd.DataFrame], station: str | None
+) -> pd.DataFrame:
+    if not station:
+        return frame
+    return by_station.get(station, frame.iloc[0:0])
+
+
+def _station_mask(stations: pd.Series, codes: np.ndarray, station: str) -> np.ndarray:
+    """Boolean mask of rows whose categorical ``stations`` value is ``station``."""
+    categories = stations.cat.categories
+    if station not in categories:
+        return np.zeros(len(codes), dtype=bool)
+    return codes == categories.get_loc(station)
+
 
 class DataLoader:
     """Lazy-loading cache for WideOrbit sample CSVs."""
@@ -32,36 +162,138 @@ class DataLoader:
     def __init__(self, sample_dir: Path):
         self._dir = sample_dir
         self._orders: pd.DataFrame | None = None
+        self._advertiser_by_order: pd.Series | None = None
         self._spots: pd.DataFrame | None = None
         self._inventory: pd.DataFrame | None = None
+        self._revenue_spots: pd.DataFrame | None = None
+        self._spots_by_station: dict[str, pd.DataFrame] | None = None
+        self._revenue_spots_by_station: dict[str, pd.DataFrame] | None = None
+        self._spot_arrays: SpotArrays | None = None
+        self._stations: tuple[str, ...] | None = None
+        self._inventory_arrays: InventoryArrays | None = None
 
     @property
     def orders(self) -> pd.DataFrame:
         if self._orders is None:
-            self._orders = pd.read_csv(
-                self._dir / "orders.csv",
-                parse_dates=["order_date", "start_date", "end_date"],
-            )
+            self._orders = _read_csv(self._dir / "orders.csv", ORDERS_COLUMN_TYPES)
         return self._orders
 
+    @property
+    def advertiser_by_order(self) -> pd.Series:
+        """order_id → advertiser_name lookup, for Series.map instead of a merge."""
+        if self._advertiser_by_order is None:
+            orders = self.orders
+            self._advertiser_by_order = pd.Series(
+                orders["advertiser_name"].to_numpy(),
+                index=orders["order_id"].to_numpy(),
+            )
+        return self._advertiser_by_order
+
     @property
     def spots(self) -> pd.DataFrame:
         if self._spots is None:
-            self._spots = pd.read_csv(
-                self._dir / "spots.csv",
-                parse_dates=["air_date"],
-            )
+            spots = _read_csv(self._dir / "spots.csv", SPOTS_COLUMN_TYPES)
+            # Low-cardinality keys as Categorical: masks and groupbys run on int8 codes
+            spots["status"] = _as_category(spots["status"], STATUS_ORDER)
+            spots["daypart"] = _as_category(spots["daypart"], DAYPART_ORDER)
+            spots["station"] = _as_category(spots["station"])
+            self._stations = tuple(sorted(spots["station"].cat.categories))
+
+            # Derived columns computed once here so route handlers only select
+            air_date = spots["air_date"].dt
+            spots["year"] = air_date.year.astype("int16")
+            spots["doy"] = air_date.dayofyear.astype("int16")
+            spots["month_period"] = air_date.to_period("M").astype(str)
+            spots["quarter_period"] = air_date.to_period("Q").astype(str)
+            spots["is_revenue"] = spots["status"].isin(REVENUE_STATUSES)
+            spots["is_preempted"] = spots["status"] == "preempted"
+            spots["is_makegood"] = spots["status"] == "makegood"
+            self._spots = spots
         return self._spots
 
+    @property
+    def revenue_spots(self) -> pd.DataFrame:
+        """Spots with a revenue status (REVENUE_STATUSES), sliced once."""
+        if self._revenue_spots is None:
+            spots = self.spots
+            self._revenue_spots = spots.loc[spots["is_revenue"]].reset_index(drop=True)
+        return self._revenue_spots
+
+    # ── Per-station partitions ───────────────────────────────────────────
+    # Built on first use; a station query is then a dict lookup instead of
+    # a boolean scan over every row. Unknown stations get an empty frame.
+
+    def spots_for_station(self, station: str | None) -> pd.DataFrame:
+        if self._spots_by_station is None:
+            self._spots_by_station = _split_by_station(self.spots)
+        return _for_station(self.spots, self._spots_by_station, station)
+
+    def revenue_spots_for_station(self, station: str | None) -> pd.DataFrame:
+        if self._revenue_spots_by_station is None:
+            self._revenue_spots_by_station = _split_by_station(self.revenue_spots)
+        return _for_station(self.revenue_spots, self._revenue_spots_by_station, station)
+
+    @property
+    def spot_arrays(self) -> SpotArrays:
+        if self._spot_arrays is None:
+            spots = self.spots
+            self._spot_arrays = SpotArrays(
+                status=_contiguous(spots["status"].cat.codes),
+                daypart=_contiguous(spots["daypart"].cat.codes),
+                station=_contiguous(spots["station"].cat.codes),
+                rate=_contiguous(spots["rate"], np.float64),
+                year=_contiguous(spots["year"]),
+                doy=_contiguous(spots["doy"]),
+                is_revenue=_contiguous(spots["is_revenue"]),
+            )
+        return self._spot_arrays
+
+    def mask_revenue_station(self, station: str | None = None) -> np.ndarray:
+        """Boolean mask over spots: revenue status, optionally one station."""
+        arrays = self.spot_arrays
+        if not station:
+            return arrays.is_revenue
+        return arrays.is_revenue & _station_mask(self.spots["station"], arrays.station, station)
+
     @property
     def inventory(self) -> pd.DataFrame:
         if self._inventory is None:
-            self._inventory = pd.read_csv(
-                self._dir / "inventory.csv",
-                parse_dates=["date"],
-            )
+            inventory = _read_csv(self._dir / "inventory.csv", INVENTORY_COLUMN_TYPES)
+            inventory["daypart"] = _as_category(inventory["daypart"], DAYPART_ORDER)
+            inventory["station"] = _as_category(inventory["station"])
+            inventory["year"] = inventory["date"].dt.year.astype("int16")
+            inventory["doy"] = inventory["date"].dt.dayofyear.astype("int16")
+            self._inventory = inventory
         return self._inventory
 
+    @property
+    def inventory_arrays(self) -> InventoryArrays:
+        if self._inventory_arrays is None:
+            inventory = self.inventory
+            self._inventory_arrays = InventoryArrays(
+                daypart=_contiguous(inventory["daypart"].cat.codes),
+                station=_contiguous(inventory["station"].cat.codes),
+                booked=_contiguous(inventory["booked"], np.int64),
+                total_avails=_contiguous(inventory["total_avails"], np.int64),
+                year=_contiguous(inventory["year"]),
+                doy=_contiguous(inventory["doy"]),
+            )
+        return self._inventory_arrays
+
+    def mask_inventory_station(self, station: str | None = None) -> np.ndarray:
+        """Boolean mask over inventory rows, optionally one station."""
+        arrays = self.inventory_arrays
+        if not station:
+            return np.ones(len(arrays.station), dtype=bool)
+        return _station_mask(self.inventory["station"], arrays.station, station)
+
+    @property
+    def stations(self) -> tuple[str, ...]:
+        """Sorted station call signs present in spots, computed once at load."""
+        if self._stations is None:
+            self.spots
+        return self._stations
+
     def get_stations(self) -> List[str]:
         """Return sorted list of unique station call signs."""
-        return sorted(self.spots["station"].unique().tolist())
+        return list(self.stations)
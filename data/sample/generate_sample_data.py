@@ -9,17 +9,38 @@ Generates realistic sample data for a 5-station broadcast group:
 Usage:
     python data/sample/generate_sample_data.py
     python data/sample/generate_sample_data.py --output-dir data/sample --seed 42
+    python data/sample/generate_sample_data.py --no-validate
+    python data/sample/generate_sample_data.py --format both
+    python data/sample/generate_sample_data.py --no-summary
 """
 
 import argparse
 import logging
 import sys
-from datetime import date, datetime, time, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    # numba is optional; without it generate_spots uses the NumPy path and
+    # the kernel below stays a plain Python function.
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        return lambda fn: fn
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
@@ -38,6 +59,12 @@ STATIONS = {
     "KWYB-TV": {"market": "Butte",    "dma_rank": 190, "size": 0.10},
 }
 
+# Order-level station selection weights, in STATIONS order. Sqrt of market
+# size is tempered to avoid over-concentrating on the largest market.
+STATION_SQRT_SIZES = np.array([cfg["size"] ** 0.5 for cfg in STATIONS.values()])
+# Which stations a local advertiser buys (national advertisers pick uniformly)
+LOCAL_STATION_WEIGHTS = np.array([0.10, 0.25, 0.25, 0.20, 0.20])
+
 # ── Daypart Configuration ────────────────────────────────────────────────────
 # Matches wo_fields.yaml daypart_mapping exactly
 
@@ -58,6 +85,16 @@ _raw_vol = {dp: cfg["revenue_share"] / cfg["base_aur_mult"] for dp, cfg in DAYPA
 _vol_total = sum(_raw_vol.values())
 DAYPART_VOLUME_WEIGHTS = {dp: v / _vol_total for dp, v in _raw_vol.items()}
 
+# Array forms in DAYPARTS order, for per-spot draws
+DAYPART_CODES = list(DAYPARTS)
+DAYPART_VOLUME_WEIGHT_ARRAY = np.array([DAYPART_VOLUME_WEIGHTS[dp] for dp in DAYPART_CODES])
+# Daypart windows in minutes after midnight; Late Fringe wraps past midnight
+DAYPART_START_MINS = np.array([cfg["start"].hour * 60 + cfg["start"].minute for cfg in DAYPARTS.values()])
+DAYPART_END_MINS = np.array([cfg["end"].hour * 60 + cfg["end"].minute for cfg in DAYPARTS.values()])
+DAYPART_END_MINS[DAYPART_END_MINS <= DAYPART_START_MINS] += 24 * 60
+# "HH:MM:SS" label for each minute of the day
+_MINUTE_LABELS = np.array([f"{m // 60:02d}:{m % 60:02d}:00" for m in range(24 * 60)], dtype=object)
+
 # Sell-out rate targets by daypart (fraction of avails booked)
 SELLOUT_TARGETS = {
     "EM": 0.60, "DT": 0.55, "EF": 0.58, "EN": 0.75,
@@ -87,12 +124,42 @@ DATE_END = date(2025, 3, 31)
 # "Today" cutoff for determining scheduled vs aired status
 TODAY_CUTOFF = date(2025, 2, 15)
 
+# Day ordinals (date.toordinal) used for array date arithmetic
+DATE_START_ORD = DATE_START.toordinal()
+DATE_END_ORD = DATE_END.toordinal()
+_UNIX_EPOCH_ORD = date(1970, 1, 1).toordinal()
+
+
+def _ordinals_to_dates(ordinals: np.ndarray) -> np.ndarray:
+    """Convert int64 day ordinals to a datetime64[D] array."""
+    return (ordinals - _UNIX_EPOCH_ORD).astype("datetime64[D]")
+
 # ── Spot Length Distribution ──────────────────────────────────────────────────
 
 SPOT_LENGTHS = [30, 15, 60]
 SPOT_LENGTH_WEIGHTS = [0.70, 0.20, 0.10]
 SPOT_LENGTH_RATE_MULT = {15: 0.60, 30: 1.00, 60: 1.80}
 
+# ── Spot Statuses ────────────────────────────────────────────────────────────
+
+SPOT_STATUSES = ["aired", "makegood", "preempted", "scheduled"]
+
+# ── Code-indexed Config Arrays ───────────────────────────────────────────────
+# Parallel arrays indexed by integer station / daypart / length codes
+# (positions in STATIONS, DAYPARTS and SPOT_LENGTHS) for vectorized lookups.
+
+STATION_CODES = list(STATIONS)
+STATION_INDEX = {st: i for i, st in enumerate(STATION_CODES)}
+STATION_PRIME_MID = np.array([sum(PRIME_AUR_RANGES[st]) / 2 for st in STATION_CODES])
+
+DAYPART_INDEX = {dp: i for i, dp in enumerate(DAYPART_CODES)}
+DAYPART_BASE_AUR = np.array([DAYPARTS[dp]["base_aur_mult"] for dp in DAYPART_CODES])
+DAYPART_SELLOUT = np.array([SELLOUT_TARGETS[dp] for dp in DAYPART_CODES])
+DAYPART_YOY = np.array([YOY_GROWTH[dp] for dp in DAYPART_CODES])
+NEWS_DAYPART_IDX = [DAYPART_INDEX["EN"], DAYPART_INDEX["LN"]]
+
+SPOT_LENGTH_MULT = np.array([SPOT_LENGTH_RATE_MULT[length] for length in SPOT_LENGTHS])
+
 # ── Seasonal Multipliers ─────────────────────────────────────────────────────
 
 def seasonal_rate_multiplier(d: date) -> float:
@@ -119,6 +186,20 @@ def seasonal_volume_multiplier(d: date) -> float:
     return 1.00
 
 
+def _month_index(dates: np.ndarray) -> np.ndarray:
+    """Zero-based month (0 = Jan) of a datetime64 array."""
+    return dates.astype("datetime64[M]").astype(np.int64) % 12
+
+
+# Month-indexed lookups (0 = Jan) for vectorized seasonal adjustment
+_SEASONAL_RATE_BY_MONTH = np.array(
+    [seasonal_rate_multiplier(date(2000, m, 1)) for m in range(1, 13)]
+)
+_SEASONAL_VOLUME_BY_MONTH = np.array(
+    [seasonal_volume_multiplier(date(2000, m, 1)) for m in range(1, 13)]
+)
+
+
 # ── Advertiser Configuration ─────────────────────────────────────────────────
 
 def generate_advertisers(rng: np.random.Generator) -> List[Dict]:
@@ -217,32 +298,99 @@ def generate_programs() -> Dict[str, List[str]]:
 
 # ── Rate Calculation ─────────────────────────────────────────────────────────
 
-def calculate_spot_rate(
-    station: str,
-    daypart: str,
-    length: int,
-    air_date: date,
-    rng: np.random.Generator,
-) -> float:
-    """Calculate a realistic spot rate based on station, daypart, length, date."""
-    prime_low, prime_high = PRIME_AUR_RANGES[station]
-    prime_mid = (prime_low + prime_high) / 2
-    daypart_mult = DAYPARTS[daypart]["base_aur_mult"]
-    base_rate = prime_mid * daypart_mult
-    length_mult = SPOT_LENGTH_RATE_MULT[length]
-    season_mult = seasonal_rate_multiplier(air_date)
+def _rate_factors(
+    station_idx: np.ndarray,
+    dp_idx: np.ndarray,
+    length_idx: np.ndarray,
+    air_dates: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Per-spot (base_rate, length_mult, season_mult, yoy_mult) arrays."""
+    base_rate = STATION_PRIME_MID[station_idx] * DAYPART_BASE_AUR[dp_idx]
+    length_mult = SPOT_LENGTH_MULT[length_idx]
+    season_mult = _SEASONAL_RATE_BY_MONTH[_month_index(air_dates)]
 
     # YoY: 2025 dates get growth bump
-    yoy_mult = 1.0
-    if air_date.year >= 2025:
-        yoy_mult = 1.0 + YOY_GROWTH[daypart]
+    years = air_dates.astype("datetime64[Y]").astype(np.int64) + 1970
+    yoy_mult = np.where(years >= 2025, 1.0 + DAYPART_YOY[dp_idx], 1.0)
+    return base_rate, length_mult, season_mult, yoy_mult
 
+
+def _rate_noise(n: int, rng: np.random.Generator) -> np.ndarray:
+    """Multiplicative rate noise: ±15%."""
+    return np.clip(rng.normal(1.0, 0.08, size=n), 0.85, 1.15)
+
+
+def calculate_spot_rates(
+    station_idx: np.ndarray,
+    dp_idx: np.ndarray,
+    length_idx: np.ndarray,
+    air_dates: np.ndarray,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Calculate realistic spot rates based on station, daypart, length, date.
+
+    Vectorized over all spots; station, daypart and length are integer
+    codes and ``air_dates`` is a datetime64[D] array.
+    """
+    base_rate, length_mult, season_mult, yoy_mult = _rate_factors(
+        station_idx, dp_idx, length_idx, air_dates
+    )
     rate = base_rate * length_mult * season_mult * yoy_mult
-    # Add noise: ±15%
-    noise = rng.normal(1.0, 0.08)
-    noise = max(0.85, min(1.15, noise))
-    rate *= noise
-    return round(rate, 2)
+    rate *= _rate_noise(len(rate), rng)
+    return np.round(rate, 2)
+
+
+@njit(parallel=True, cache=True)
+def _rate_status_kernel(
+    base_rate, length_mult, season_mult, yoy_mult, noise,
+    future, rolls, preempt_chance, mg_chance,
+):
+    """Fused per-spot rate product and status thresholding.
+
+    Returns raw (unrounded) rates and int8 codes into SPOT_STATUSES.
+    """
+    n = base_rate.shape[0]
+    rates = np.empty(n, dtype=np.float64)
+    codes = np.empty(n, dtype=np.int8)
+    for i in prange(n):
+        rates[i] = base_rate[i] * length_mult[i] * season_mult[i] * yoy_mult[i] * noise[i]
+        if future[i]:
+            codes[i] = 3  # scheduled
+        elif rolls[i] < preempt_chance[i]:
+            codes[i] = 2  # preempted
+        elif rolls[i] < preempt_chance[i] + mg_chance[i]:
+            codes[i] = 1  # makegood
+        else:
+            codes[i] = 0  # aired
+    return rates, codes
+
+
+def _spot_rates_and_statuses(
+    station_idx: np.ndarray,
+    dp_idx: np.ndarray,
+    length_idx: np.ndarray,
+    air_dates: np.ndarray,
+    high_preempt_station: str,
+    rng: np.random.Generator,
+    use_kernel: bool = HAS_NUMBA,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Rates and status codes for every spot.
+
+    Uses the numba kernel when available, otherwise the NumPy path. Both
+    draw from ``rng`` in the same order, so results match for a seed.
+    """
+    if not use_kernel:
+        rates = calculate_spot_rates(station_idx, dp_idx, length_idx, air_dates, rng)
+        codes = _determine_statuses(air_dates, dp_idx, station_idx, high_preempt_station, rng)
+        return rates, codes
+
+    factors = _rate_factors(station_idx, dp_idx, length_idx, air_dates)
+    noise = _rate_noise(len(air_dates), rng)
+    rolls = rng.random(len(air_dates))
+    preempt_chance, mg_chance = _status_chances(dp_idx, station_idx, high_preempt_station)
+    future = air_dates > np.datetime64(TODAY_CUTOFF)
+    rates, codes = _rate_status_kernel(*factors, noise, future, rolls, preempt_chance, mg_chance)
+    return np.round(rates, 2), codes
 
 
 # ── Order Generation ─────────────────────────────────────────────────────────
@@ -257,99 +405,98 @@ def generate_orders(
     Uses recurring campaign patterns spread evenly across the time range.
     Includes warm-up orders starting in Q4 2023 whose flights extend into
     Q1 2024, so both Q1 periods have comparable spillover volume.
-    """
-    orders = []
-    order_counter = 1000
 
+    Per-order random values are drawn in one batch per attribute and
+    combined as int64 day ordinals.
+    """
     # Extended range for warm-up orders (flights starting Oct-Dec 2023
     # that spill into Jan-Mar 2024, giving Q1 2024 comparable spillover)
     WARMUP_START = date(2023, 10, 1)
     total_days = (DATE_END - DATE_START).days
     warmup_days = (DATE_START - WARMUP_START).days  # 92 days of warm-up
 
-    for adv in advertisers:
-        share = adv["share"]
-        if share >= 0.06:
-            n_orders = rng.integers(26, 40)
-        elif share >= 0.03:
-            n_orders = rng.integers(14, 24)
-        elif share >= 0.015:
-            n_orders = rng.integers(8, 16)
-        elif share >= 0.008:
-            n_orders = rng.integers(4, 10)
-        else:
-            n_orders = rng.integers(2, 5)
-
-        # Assign agency (~70% through agencies)
-        if adv["type"] == "national" or rng.random() < 0.55:
-            agency = rng.choice(agencies)
-        else:
-            agency = None
+    n_adv = len(advertisers)
+    adv_names = np.array([a["name"] for a in advertisers], dtype=object)
+    shares = np.array([a["share"] for a in advertisers])
+    is_national = np.array([a["type"] == "national" for a in advertisers])
 
-        # Determine which stations this advertiser buys
-        station_list = list(STATIONS.keys())
-        if adv["type"] == "national":
-            n_stations = rng.integers(3, 6)
-            adv_stations = list(rng.choice(station_list, size=n_stations, replace=False))
-        else:
-            n_stations = rng.integers(1, 3)
-            local_weights = np.array([0.10, 0.25, 0.25, 0.20, 0.20])
-            adv_stations = list(rng.choice(
-                station_list, size=n_stations, replace=False, p=local_weights
-            ))
-
-        # Add warm-up orders (Q4 2023 → spill into Q1 2024)
-        # ~20% of orders are warm-up, proportional to advertiser size
-        n_warmup = max(1, int(n_orders * 0.18))
-        full_range_days = warmup_days + total_days  # Oct 2023 through Mar 2025
-
-        for i in range(n_orders + n_warmup):
-            order_counter += 1
-            # Weight station selection by sqrt of market size (tempered to avoid
-            # over-concentrating on KIRO which is 4-8x larger than others)
-            stn_sizes = np.array([STATIONS[s]["size"] ** 0.5 for s in adv_stations])
-            stn_probs = stn_sizes / stn_sizes.sum()
-            station = rng.choice(adv_stations, p=stn_probs)
-
-            flight_weeks = int(rng.choice([1, 2, 4, 4, 8, 8, 13, 13, 13]))
-            flight_days = flight_weeks * 7
-
-            if i < n_warmup:
-                # Warm-up order: starts in Q4 2023
-                start_offset = int(rng.integers(0, warmup_days))
-                start_date = WARMUP_START + timedelta(days=start_offset)
-            else:
-                # Regular order: spread evenly across main range
-                idx = i - n_warmup
-                base_offset = int((idx / n_orders) * total_days)
-                jitter = int(rng.integers(-14, 15))
-                start_offset = max(0, min(total_days - flight_days, base_offset + jitter))
-                start_date = DATE_START + timedelta(days=start_offset)
-
-            end_date = start_date + timedelta(days=flight_days - 1)
-            if end_date > DATE_END:
-                end_date = DATE_END
-            # Skip warm-up orders that don't reach into the main date range
-            if end_date < DATE_START:
-                continue
-
-            lead_days = int(rng.integers(1, 31))
-            order_date = start_date - timedelta(days=lead_days)
-            if order_date < date(2023, 9, 1):
-                order_date = date(2023, 9, 1)
-
-            orders.append({
-                "order_id": f"WO-{order_counter:05d}",
-                "advertiser_name": adv["name"],
-                "agency_name": agency,
-                "order_date": order_date.isoformat(),
-                "start_date": start_date.isoformat(),
-                "end_date": end_date.isoformat(),
-                "order_total": 0.0,  # backfilled later
-                "station": station,
-            })
-
-    df = pd.DataFrame(orders)
+    # Orders per advertiser, scaled by share of spend
+    share_bins = [shares >= 0.06, shares >= 0.03, shares >= 0.015, shares >= 0.008]
+    n_orders = rng.integers(
+        np.select(share_bins, [26, 14, 8, 4], default=2),
+        np.select(share_bins, [40, 24, 16, 10], default=5),
+    )
+    # Add warm-up orders (Q4 2023 → spill into Q1 2024)
+    # ~20% of orders are warm-up, proportional to advertiser size
+    n_warmup = np.maximum(1, (n_orders * 0.18).astype(np.int64))
+
+    # Assign agency (~70% through agencies)
+    uses_agency = is_national | (rng.random(n_adv) < 0.55)
+    adv_agency = np.where(uses_agency, rng.choice(len(agencies), size=n_adv), -1)
+
+    # Determine which stations each advertiser buys, then cache one CDF of
+    # order-level station probabilities per advertiser.
+    station_list = list(STATIONS.keys())
+    n_stations = np.where(
+        is_national, rng.integers(3, 6, size=n_adv), rng.integers(1, 3, size=n_adv)
+    )
+    # Weighted sampling without replacement for every advertiser at once
+    # (Efraimidis-Spirakis): keep the n_stations largest keys u ** (1 / w).
+    # National advertisers pick uniformly.
+    pick_weights = np.where(is_national[:, None], 1.0, LOCAL_STATION_WEIGHTS)
+    keys = rng.random((n_adv, len(station_list))) ** (1.0 / pick_weights)
+    key_rank = (-keys).argsort(axis=1).argsort(axis=1)
+    stn_probs = np.where(key_rank < n_stations[:, None], STATION_SQRT_SIZES, 0.0)
+    stn_cdf = np.cumsum(stn_probs, axis=1)
+    stn_cdf /= stn_cdf[:, -1:]
+
+    # One row per candidate order; warm-up orders come first in each
+    # advertiser's block.
+    n_total = n_orders + n_warmup
+    adv_idx = np.repeat(np.arange(n_adv), n_total)
+    n = len(adv_idx)
+    pos = np.arange(n) - np.repeat(np.cumsum(n_total) - n_total, n_total)
+    is_warmup = pos < n_warmup[adv_idx]
+
+    # All per-order random draws in one batch each
+    station_idx = np.argmax(stn_cdf[adv_idx] > rng.random(n)[:, None], axis=1)
+    flight_days = rng.choice([1, 2, 4, 4, 8, 8, 13, 13, 13], size=n) * 7
+    warmup_offset = rng.integers(0, warmup_days, size=n)
+    jitter = rng.integers(-14, 15, size=n)
+    lead_days = rng.integers(1, 31, size=n)
+
+    # Regular orders: spread evenly across main range
+    base_offset = ((pos - n_warmup[adv_idx]) / n_orders[adv_idx] * total_days).astype(np.int64)
+    regular_offset = np.maximum(0, np.minimum(total_days - flight_days, base_offset + jitter))
+
+    start_ord = np.where(
+        is_warmup,
+        WARMUP_START.toordinal() + warmup_offset,
+        DATE_START_ORD + regular_offset,
+    )
+    end_ord = np.minimum(start_ord + (flight_days - 1), DATE_END_ORD)
+    order_ord = np.maximum(start_ord - lead_days, date(2023, 9, 1).toordinal())
+
+    # Skip warm-up orders that don't reach into the main date range; order
+    # numbers are assigned before the skip, so the gaps are kept.
+    keep = end_ord >= DATE_START_ORD
+    order_numbers = np.arange(1001, 1001 + n)[keep]
+    adv_idx = adv_idx[keep]
+    start_ord, end_ord = start_ord[keep], end_ord[keep]
+
+    df = pd.DataFrame({
+        "order_id": [f"WO-{num:05d}" for num in order_numbers],
+        "advertiser_name": pd.Categorical(adv_names[adv_idx], categories=pd.unique(adv_names)),
+        "agency_name": pd.Categorical.from_codes(adv_agency[adv_idx], categories=agencies),
+        "order_date": _ordinals_to_dates(order_ord[keep]).astype(str),
+        "start_date": _ordinals_to_dates(start_ord).astype(str),
+        "end_date": _ordinals_to_dates(end_ord).astype(str),
+        "order_total": 0.0,  # backfilled later
+        "station": pd.Categorical.from_codes(station_idx[keep], categories=station_list),
+        # Day ordinals carried for generate_spots; not written to CSV
+        "start_ord": start_ord,
+        "end_ord": end_ord,
+    })
     logger.info(f"Generated {len(df)} orders across {df['station'].nunique()} stations")
     return df
 
@@ -361,10 +508,13 @@ def generate_spots(
     advertisers: List[Dict],
     rng: np.random.Generator,
 ) -> pd.DataFrame:
-    """Generate ~20,000 spots referencing valid orders."""
+    """Generate ~20,000 spots referencing valid orders.
+
+    Columnar: spot counts are computed per order as arrays, then every
+    per-spot attribute is drawn for all spots at once and the order
+    columns are expanded with np.repeat.
+    """
     programs = generate_programs()
-    spots = []
-    spot_counter = 100000
 
     # Build advertiser weight lookup
     adv_weights = {a["name"]: a["share"] for a in advertisers}
@@ -372,143 +522,127 @@ def generate_spots(
     # Station with notably worse preemption (for spec testing)
     high_preempt_station = "KHQ-TV"
 
-    for _, order in orders_df.iterrows():
-        start = date.fromisoformat(order["start_date"])
-        end = date.fromisoformat(order["end_date"])
-        station = order["station"]
-        adv_name = order["advertiser_name"]
-        # Clip to main date range (warm-up orders may start before DATE_START)
-        effective_start = max(start, DATE_START)
-        effective_end = min(end, DATE_END)
-        flight_days = (effective_end - effective_start).days + 1
-        if flight_days <= 0:
-            continue
-
-        adv_share = adv_weights.get(adv_name, 0.005)
-
-        # Spots per order: proportional to flight length and advertiser weight.
-        if adv_share >= 0.06:
-            spots_per_week = rng.integers(6, 14)
-        elif adv_share >= 0.03:
-            spots_per_week = rng.integers(5, 11)
-        elif adv_share >= 0.015:
-            spots_per_week = rng.integers(3, 8)
-        elif adv_share >= 0.008:
-            spots_per_week = rng.integers(2, 6)
-        else:
-            spots_per_week = rng.integers(1, 4)
+    start_ord = orders_df["start_ord"].to_numpy()
+    end_ord = orders_df["end_ord"].to_numpy()
+    # Clip to main date range (warm-up orders may start before DATE_START)
+    effective_start_ord = np.maximum(start_ord, DATE_START_ORD)
+    effective_end_ord = np.minimum(end_ord, DATE_END_ORD)
+    flight_days = effective_end_ord - effective_start_ord + 1
 
-        n_spots = max(1, int(spots_per_week * flight_days / 7))
+    in_range = flight_days > 0
+    orders = orders_df[in_range]
+    start_ord = start_ord[in_range]
+    effective_start_ord, flight_days = effective_start_ord[in_range], flight_days[in_range]
 
-        # Volume seasonal adjustment
-        mid_date = start + timedelta(days=flight_days // 2)
-        vol_mult = seasonal_volume_multiplier(mid_date)
-        n_spots = max(1, int(n_spots * vol_mult))
+    adv_share = orders["advertiser_name"].map(adv_weights).fillna(0.005).to_numpy()
 
-        # Distribute across dayparts weighted by volume (not revenue share)
-        daypart_codes = list(DAYPARTS.keys())
-        daypart_weights = np.array([DAYPART_VOLUME_WEIGHTS[dp] for dp in daypart_codes])
+    # Spots per order: proportional to flight length and advertiser weight.
+    share_bins = [adv_share >= 0.06, adv_share >= 0.03, adv_share >= 0.015, adv_share >= 0.008]
+    spw_low = np.select(share_bins, [6, 5, 3, 2], default=1)
+    spw_high = np.select(share_bins, [14, 11, 8, 6], default=4)
+    spots_per_week = rng.integers(spw_low, spw_high)
 
-        daypart_assignments = rng.choice(daypart_codes, size=n_spots, p=daypart_weights)
+    n_spots = np.maximum(1, (spots_per_week * flight_days / 7).astype(np.int64))
 
-        for i in range(n_spots):
-            spot_counter += 1
-            dp = daypart_assignments[i]
-            dp_info = DAYPARTS[dp]
+    # Volume seasonal adjustment
+    mid_date = _ordinals_to_dates(start_ord + flight_days // 2)
+    vol_mult = _SEASONAL_VOLUME_BY_MONTH[_month_index(mid_date)]
+    n_spots = np.maximum(1, (n_spots * vol_mult).astype(np.int64))
 
-            # Random air_date within flight (clipped to main range)
-            day_offset = int(rng.integers(0, flight_days))
-            air_date = effective_start + timedelta(days=day_offset)
+    total_spots = int(n_spots.sum())
+    order_idx = np.repeat(np.arange(len(orders)), n_spots)
 
-            # Random air_time within daypart window
-            air_time = _random_time_in_daypart(dp_info["start"], dp_info["end"], rng)
+    # Distribute across dayparts weighted by volume (not revenue share)
+    dp_idx = rng.choice(len(DAYPART_CODES), size=total_spots, p=DAYPART_VOLUME_WEIGHT_ARRAY)
 
-            # Spot length
-            length = int(rng.choice(SPOT_LENGTHS, p=SPOT_LENGTH_WEIGHTS))
+    # Random air_date within flight (clipped to main range)
+    day_offset = rng.integers(0, flight_days[order_idx])
+    air_dates = _ordinals_to_dates(effective_start_ord[order_idx] + day_offset)
 
-            # Rate
-            rate = calculate_spot_rate(station, dp, length, air_date, rng)
+    # Spot length
+    length_idx = rng.choice(len(SPOT_LENGTHS), size=total_spots, p=SPOT_LENGTH_WEIGHTS)
 
-            # Status
-            status = _determine_status(
-                air_date, dp, station, high_preempt_station, rng
-            )
+    # Program, drawn per daypart
+    program_names = pd.Index(pd.unique(np.concatenate(list(programs.values()))))
+    program_idx = np.empty(total_spots, dtype=np.int64)
+    for i, dp in enumerate(DAYPART_CODES):
+        is_dp = dp_idx == i
+        dp_programs = program_names.get_indexer(programs[dp])
+        program_idx[is_dp] = dp_programs[rng.choice(len(dp_programs), size=int(is_dp.sum()))]
 
-            # Program
-            program = rng.choice(programs[dp])
+    station_idx = pd.Categorical(orders["station"], categories=STATION_CODES).codes[order_idx]
 
-            spots.append({
-                "spot_id": f"SP-{spot_counter:06d}",
-                "order_id": order["order_id"],
-                "air_date": air_date.isoformat(),
-                "air_time": air_time.strftime("%H:%M:%S"),
-                "daypart": dp,
-                "program": program,
-                "length": length,
-                "rate": rate,
-                "status": status,
-                "station": station,
-            })
+    # Rate and status
+    rates, status_codes = _spot_rates_and_statuses(
+        station_idx, dp_idx, length_idx, air_dates, high_preempt_station, rng
+    )
 
-    df = pd.DataFrame(spots)
+    # Time: random minute within the daypart window
+    air_mins = rng.integers(DAYPART_START_MINS[dp_idx], DAYPART_END_MINS[dp_idx]) % (24 * 60)
+    air_times = _MINUTE_LABELS[air_mins]
+
+    spot_numbers = np.arange(100001, 100001 + total_spots)
+    df = pd.DataFrame({
+        "spot_id": [f"SP-{n:06d}" for n in spot_numbers],
+        "order_id": orders["order_id"].to_numpy()[order_idx],
+        "air_date": air_dates.astype(str),
+        "air_time": air_times,
+        "daypart": pd.Categorical.from_codes(dp_idx, categories=DAYPART_CODES),
+        "program": pd.Categorical.from_codes(program_idx, categories=program_names),
+        "length": np.asarray(SPOT_LENGTHS)[length_idx],
+        "rate": rates,
+        "status": pd.Categorical.from_codes(status_codes, categories=SPOT_STATUSES),
+        "station": pd.Categorical.from_codes(station_idx, categories=STATION_CODES),
+    })
     logger.info(f"Generated {len(df)} spots across {df['station'].nunique()} stations")
     return df
 
 
-def _random_time_in_daypart(start: time, end: time, rng: np.random.Generator) -> time:
-    """Generate a random time within a daypart window."""
-    start_mins = start.hour * 60 + start.minute
-    end_mins = end.hour * 60 + end.minute
-
-    # Handle Late Fringe wrapping past midnight
-    if end_mins <= start_mins:
-        end_mins += 24 * 60
-
-    rand_mins = int(rng.integers(start_mins, end_mins))
-    rand_mins = rand_mins % (24 * 60)
-    return time(rand_mins // 60, rand_mins % 60)
-
-
-def _determine_status(
-    air_date: date,
-    daypart: str,
-    station: str,
+def _status_chances(
+    dp_idx: np.ndarray,
+    station_idx: np.ndarray,
+    high_preempt_station: str,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-spot (preempt_chance, mg_chance) arrays."""
+    n = len(dp_idx)
+    # Base preemption rate: ~2.5%, higher in news dayparts at high_preempt_station
+    preempt_chance = np.full(n, 0.020)
+    mg_chance = np.full(n, 0.015)
+    preempt_chance[np.isin(dp_idx, NEWS_DAYPART_IDX)] = 0.035  # Breaking news preemptions
+    is_high = station_idx == STATION_INDEX[high_preempt_station]
+    preempt_chance[is_high] *= 1.8  # KIRO notably worse
+    mg_chance[is_high] *= 1.5
+    return preempt_chance, mg_chance
+
+
+def _determine_statuses(
+    air_dates: np.ndarray,
+    dp_idx: np.ndarray,
+    station_idx: np.ndarray,
     high_preempt_station: str,
     rng: np.random.Generator,
-) -> str:
-    """Determine spot status: aired, scheduled, preempted, makegood."""
-    if air_date > TODAY_CUTOFF:
-        return "scheduled"
+) -> np.ndarray:
+    """Determine spot status for every spot as int8 codes into SPOT_STATUSES."""
+    future = air_dates > np.datetime64(TODAY_CUTOFF)
+    preempt_chance, mg_chance = _status_chances(dp_idx, station_idx, high_preempt_station)
 
-    # Base preemption rate: ~2.5%, higher in news dayparts at high_preempt_station
-    preempt_chance = 0.020
-    mg_chance = 0.015
-    if daypart in ("EN", "LN"):
-        preempt_chance = 0.035  # Breaking news preemptions
-    if station == high_preempt_station:
-        preempt_chance *= 1.8  # KIRO notably worse
-        mg_chance *= 1.5
-
-    roll = rng.random()
-    if roll < preempt_chance:
-        return "preempted"
-    elif roll < preempt_chance + mg_chance:
-        return "makegood"
-    else:
-        return "aired"
+    # One roll per spot; ignored for future (scheduled) spots
+    rolls = rng.random(len(air_dates))
+    return np.select(
+        [future, rolls < preempt_chance, rolls < preempt_chance + mg_chance],
+        [3, 2, 1],  # scheduled, preempted, makegood
+        default=0,  # aired
+    ).astype(np.int8)
 
 
 # ── Order Total Backfill ─────────────────────────────────────────────────────
 
 def update_order_totals(orders_df: pd.DataFrame, spots_df: pd.DataFrame) -> pd.DataFrame:
-    """Set order_total = sum of spot rates for each order."""
-    totals = spots_df.groupby("order_id")["rate"].sum().reset_index()
-    totals.columns = ["order_id", "calculated_total"]
-    merged = orders_df.merge(totals, on="order_id", how="left")
-    merged["order_total"] = merged["calculated_total"].fillna(0).round(2)
-    merged.drop(columns=["calculated_total"], inplace=True)
-    logger.info(f"Updated order totals. Total revenue: ${merged['order_total'].sum():,.2f}")
-    return merged
+    """Set order_total = sum of spot rates for each order, in place."""
+    totals = spots_df.groupby("order_id", sort=False)["rate"].sum()
+    orders_df["order_total"] = orders_df["order_id"].map(totals).fillna(0).round(2)
+    logger.info(f"Updated order totals. Total revenue: ${orders_df['order_total'].sum():,.2f}")
+    return orders_df
 
 
 # ── Inventory Generation ─────────────────────────────────────────────────────
@@ -522,80 +656,56 @@ def generate_inventory(
     Derives total_avails from the average booked rate per station/daypart
     and target sell-out rates, so aggregate sell-out metrics match targets.
     """
-    all_dates = pd.date_range(DATE_START, DATE_END, freq="D")
+    all_dates = pd.date_range(DATE_START, DATE_END, freq="D").strftime("%Y-%m-%d")
     n_days = len(all_dates)
-    rows = []
-
-    # Count booked spots per station/daypart/date
-    booked_counts = (
-        spots_df.groupby(["station", "daypart", "air_date"])
-        .size()
-        .reset_index(name="booked_count")
-    )
-    booked_lookup = {}
-    for _, row in booked_counts.iterrows():
-        key = (row["station"], row["daypart"], row["air_date"])
-        booked_lookup[key] = row["booked_count"]
-
-    # Two-pass allocation: guarantee exact total avails per station/daypart
-    # to hit target sell-out rates, then distribute across days.
-    station_dp_totals = (
-        spots_df.groupby(["station", "daypart"]).size().reset_index(name="total_spots")
-    )
-    total_booked_map = {}
-    for _, row in station_dp_totals.iterrows():
-        total_booked_map[(row["station"], row["daypart"])] = row["total_spots"]
-
-    for station in STATIONS:
-        for dp_code in DAYPARTS:
-            key_base = (station, dp_code)
-            total_booked = total_booked_map.get(key_base, 0)
-            target_so = SELLOUT_TARGETS[dp_code]
-            total_target_avails = int(round(total_booked / target_so)) if total_booked > 0 else n_days
-
-            # Pass 1: collect booked per day, set floor at booked
-            day_data = []
-            for d in all_dates:
-                d_date = d.date()
-                key = (station, dp_code, d_date.isoformat())
-                booked = booked_lookup.get(key, 0)
-                day_data.append({"date": d_date, "booked": booked, "avails": booked})
-
-            # Pass 2: distribute remaining avails (total_target - sum_booked)
-            # across all days, weighted toward days with lower bookings
-            sum_floor = sum(dd["booked"] for dd in day_data)
-            remaining_to_add = max(0, total_target_avails - sum_floor)
-
-            if remaining_to_add > 0:
-                # Generate random weights and distribute
-                raw_weights = rng.random(n_days) + 0.1
-                raw_weights /= raw_weights.sum()
-                extra_per_day = (raw_weights * remaining_to_add).astype(int)
-                # Distribute rounding remainder
-                shortfall = remaining_to_add - extra_per_day.sum()
-                if shortfall > 0:
-                    bump_indices = rng.choice(n_days, size=int(shortfall), replace=False)
-                    for idx in bump_indices:
-                        extra_per_day[idx] += 1
-                for i, dd in enumerate(day_data):
-                    dd["avails"] += int(extra_per_day[i])
-
-            for dd in day_data:
-                remaining = dd["avails"] - dd["booked"]
-                rows.append({
-                    "date": dd["date"].isoformat(),
-                    "daypart": dp_code,
-                    "station": station,
-                    "total_avails": dd["avails"],
-                    "booked": dd["booked"],
-                    "remaining": remaining,
-                })
-
-    df = pd.DataFrame(rows)
+    stations = STATION_CODES
+    dayparts = DAYPART_CODES
+
+    # Booked spots per station/daypart/date, counted straight into the full
+    # grid by flat (station, daypart, day) index
+    station_codes = pd.Categorical(spots_df["station"], categories=stations).codes.astype(np.int64)
+    daypart_codes = pd.Categorical(spots_df["daypart"], categories=dayparts).codes.astype(np.int64)
+    day_offsets = (
+        spots_df["air_date"].to_numpy(dtype="datetime64[D]") - np.datetime64(DATE_START, "D")
+    ).astype(np.int64)
+    flat_idx = (station_codes * len(dayparts) + daypart_codes) * n_days + day_offsets
+    booked = np.bincount(
+        flat_idx, minlength=len(stations) * len(dayparts) * n_days
+    ).reshape(len(stations), len(dayparts), n_days)
+
+    # Guarantee exact total avails per station/daypart to hit target
+    # sell-out rates; booked is the per-day floor.
+    total_booked = booked.sum(axis=2)
+    total_target_avails = np.where(
+        total_booked > 0, np.rint(total_booked / DAYPART_SELLOUT), n_days
+    ).astype(np.int64)
+    remaining_to_add = np.maximum(0, total_target_avails - total_booked)
+
+    # Distribute the remaining avails across days with random weights, for
+    # every station/daypart at once
+    raw_weights = rng.random(booked.shape) + 0.1
+    raw_weights /= raw_weights.sum(axis=2, keepdims=True)
+    extra_per_day = (raw_weights * remaining_to_add[..., None]).astype(np.int64)
+    # Distribute rounding remainder: +1 on `shortfall` distinct random days
+    shortfall = remaining_to_add - extra_per_day.sum(axis=2)
+    day_rank = rng.random(booked.shape).argsort(axis=2).argsort(axis=2)
+    extra_per_day += day_rank < shortfall[..., None]
+    avails = booked + extra_per_day
+
+    booked = booked.ravel()
+    avails = avails.ravel()
+    grid = np.indices((len(stations), len(dayparts), n_days)).reshape(3, -1)
+    df = pd.DataFrame({
+        "date": np.asarray(all_dates)[grid[2]],
+        "daypart": pd.Categorical.from_codes(grid[1], categories=dayparts),
+        "station": pd.Categorical.from_codes(grid[0], categories=stations),
+        "total_avails": avails,
+        "booked": booked,
+        "remaining": avails - booked,
+    })
     logger.info(
         f"Generated {len(df)} inventory rows "
-        f"({df['station'].nunique()} stations x {df['daypart'].nunique()} dayparts x "
-        f"{df['date'].nunique()} dates)"
+        f"({len(stations)} stations x {len(dayparts)} dayparts x {n_days} dates)"
     )
     return df
 
@@ -607,57 +717,59 @@ def validate_all(
     spots_df: pd.DataFrame,
     inventory_df: pd.DataFrame,
 ) -> bool:
-    """Run referential integrity and distribution checks."""
-    errors = []
-
-    # 1. Every spot references a valid order
-    valid_orders = set(orders_df["order_id"])
-    invalid_refs = spots_df[~spots_df["order_id"].isin(valid_orders)]
-    if len(invalid_refs) > 0:
-        errors.append(f"  {len(invalid_refs)} spots reference invalid order_ids")
-
-    # 2. spot.air_date within order's [start_date, end_date]
-    merged = spots_df.merge(
-        orders_df[["order_id", "start_date", "end_date", "station"]],
-        on="order_id",
-        suffixes=("", "_order"),
-    )
-    out_of_range = merged[
-        (merged["air_date"] < merged["start_date"]) |
-        (merged["air_date"] > merged["end_date"])
-    ]
-    if len(out_of_range) > 0:
-        errors.append(f"  {len(out_of_range)} spots have air_date outside order flight range")
-
-    # 3. spot.station matches order.station
-    station_mismatch = merged[merged["station"] != merged["station_order"]]
-    if len(station_mismatch) > 0:
-        errors.append(f"  {len(station_mismatch)} spots have station mismatch with order")
-
-    # 4. No null order_ids in spots
-    null_orders = spots_df["order_id"].isna().sum()
-    if null_orders > 0:
-        errors.append(f"  {null_orders} spots have null order_id")
-
-    # 5. No negative inventory remaining
-    neg_inv = inventory_df[inventory_df["remaining"] < 0]
-    if len(neg_inv) > 0:
-        errors.append(f"  {len(neg_inv)} inventory rows have negative remaining")
-
-    # 6. inventory.remaining = total_avails - booked
-    inv_check = inventory_df[
-        inventory_df["remaining"] != inventory_df["total_avails"] - inventory_df["booked"]
-    ]
-    if len(inv_check) > 0:
-        errors.append(f"  {len(inv_check)} inventory rows: remaining != total_avails - booked")
+    """Run referential integrity and distribution checks.
 
-    # 7. Future spots should be "scheduled"
-    future_non_sched = spots_df[
-        (spots_df["air_date"] > TODAY_CUTOFF.isoformat()) &
-        (spots_df["status"] != "scheduled")
-    ]
-    if len(future_non_sched) > 0:
-        errors.append(f"  {len(future_non_sched)} future spots not marked as 'scheduled'")
+    All checks are expressed as one Polars lazy query per frame and
+    collected together, so the spot/order join and the filters run in a
+    single optimized pass.
+    """
+    orders = pl.from_pandas(orders_df[["order_id", "start_date", "end_date", "station"]]).lazy()
+    spots = pl.from_pandas(spots_df[["order_id", "air_date", "station", "status"]]).lazy()
+    inventory = pl.from_pandas(inventory_df[["total_avails", "booked", "remaining"]]).lazy()
+
+    # _matched marks a join hit, so an order with a null station still counts as found
+    joined = spots.join(
+        orders.with_columns(_matched=pl.lit(True)), on="order_id", how="left", suffix="_order"
+    )
+    spot_checks = joined.select(
+        # 1. Every spot references a valid order
+        invalid_refs=pl.col("_matched").is_null().sum(),
+        # 2. spot.air_date within order's [start_date, end_date]
+        out_of_range=(
+            (pl.col("air_date") < pl.col("start_date")) | (pl.col("air_date") > pl.col("end_date"))
+        ).sum(),
+        # 3. spot.station matches order.station
+        station_mismatch=(
+            pl.col("_matched").is_not_null() & pl.col("station").ne_missing(pl.col("station_order"))
+        ).sum(),
+        # 4. No null order_ids in spots
+        null_orders=pl.col("order_id").is_null().sum(),
+        # 7. Future spots should be "scheduled"
+        future_non_sched=(
+            (pl.col("air_date") > TODAY_CUTOFF.isoformat()) & (pl.col("status") != "scheduled")
+        ).sum(),
+    )
+    inventory_checks = inventory.select(
+        # 5. No negative inventory remaining
+        neg_inv=(pl.col("remaining") < 0).sum(),
+        # 6. inventory.remaining = total_avails - booked
+        inv_check=(pl.col("remaining") != pl.col("total_avails") - pl.col("booked")).sum(),
+    )
+    spot_counts, inventory_counts = (
+        df.row(0, named=True) for df in pl.collect_all([spot_checks, inventory_checks])
+    )
+    counts = {**spot_counts, **inventory_counts}
+
+    messages = {
+        "invalid_refs": "spots reference invalid order_ids",
+        "out_of_range": "spots have air_date outside order flight range",
+        "station_mismatch": "spots have station mismatch with order",
+        "null_orders": "spots have null order_id",
+        "neg_inv": "inventory rows have negative remaining",
+        "inv_check": "inventory rows: remaining != total_avails - booked",
+        "future_non_sched": "future spots not marked as 'scheduled'",
+    }
+    errors = [f"  {counts[key]} {msg}" for key, msg in messages.items() if counts[key]]
 
     if errors:
         logger.error("VALIDATION FAILED:")
@@ -671,6 +783,100 @@ def validate_all(
 
 # ── Summary Statistics ────────────────────────────────────────────────────────
 
+# (code, index, name, target %) for the sell-out section, in report order
+_SELLOUT_REPORT_ROWS = tuple(
+    (dp, DAYPART_INDEX[dp], DAYPARTS[dp]["name"], SELLOUT_TARGETS[dp] * 100)
+    for dp in ("PR", "EN", "PA", "LN", "EM", "EF", "DT", "LF")
+)
+
+# Format specs shared by the per-row report lines, parsed once
+_fmt_money = "${:>12,.2f}".format
+_fmt_change = "{:>+11.1f}%".format
+
+_SUMMARY_CHUNKS = 8  # per-chunk accumulators, reduced after the parallel loop
+
+
+@njit(parallel=True, cache=True)
+def _summary_counts_kernel(inv_dp, booked, total, st, status, past, n_dp, n_st):
+    """Per-daypart booked/avail sums and per-station preempt/makegood counts.
+
+    Each prange chunk accumulates into its own row, so no atomics are needed.
+    Status codes index SPOT_STATUSES (1 = makegood, 2 = preempted); only
+    spots with ``past`` set are counted.
+    """
+    booked_acc = np.zeros((_SUMMARY_CHUNKS, n_dp), dtype=np.int64)
+    total_acc = np.zeros((_SUMMARY_CHUNKS, n_dp), dtype=np.int64)
+    spot_acc = np.zeros((_SUMMARY_CHUNKS, n_st), dtype=np.int64)
+    preempt_acc = np.zeros((_SUMMARY_CHUNKS, n_st), dtype=np.int64)
+    mg_acc = np.zeros((_SUMMARY_CHUNKS, n_st), dtype=np.int64)
+    n_inv, n_spots = inv_dp.shape[0], st.shape[0]
+    for c in prange(_SUMMARY_CHUNKS):
+        for i in range(c * n_inv // _SUMMARY_CHUNKS, (c + 1) * n_inv // _SUMMARY_CHUNKS):
+            booked_acc[c, inv_dp[i]] += booked[i]
+            total_acc[c, inv_dp[i]] += total[i]
+        for i in range(c * n_spots // _SUMMARY_CHUNKS, (c + 1) * n_spots // _SUMMARY_CHUNKS):
+            if past[i]:
+                spot_acc[c, st[i]] += 1
+                if status[i] == 2:
+                    preempt_acc[c, st[i]] += 1
+                elif status[i] == 1:
+                    mg_acc[c, st[i]] += 1
+    return (
+        booked_acc.sum(axis=0), total_acc.sum(axis=0),
+        preempt_acc.sum(axis=0), mg_acc.sum(axis=0), spot_acc.sum(axis=0),
+    )
+
+
+def _category_codes(values: pd.Series, categories: List[str]) -> np.ndarray:
+    """int8 positions of ``values`` in ``categories``; -1 for anything else."""
+    return pd.Index(categories).get_indexer(values).astype(np.int8)
+
+
+def _summary_counts(
+    inventory_df: pd.DataFrame,
+    spots_df: pd.DataFrame,
+    past: np.ndarray,
+    use_kernel: bool = HAS_NUMBA,
+) -> Tuple[np.ndarray, ...]:
+    """Sell-out and makegood tallies on category codes.
+
+    Returns (booked, total avails) per DAYPART_CODES entry and (preempted,
+    makegood, spots) per STATION_CODES entry, from the numba kernel when
+    available, otherwise from np.bincount.
+
+    Inventory rows with an unknown daypart and spots at an unknown station
+    are left out of the tallies. A spot with an unknown status still counts
+    toward its station's total, as neither preempted nor makegood.
+    """
+    # Category codes stay int8 (one byte per row) through the masks and gathers
+    inv_dp = _category_codes(inventory_df["daypart"], DAYPART_CODES)
+    known_dp = inv_dp >= 0
+    inv_dp = inv_dp[known_dp]
+    booked = inventory_df["booked"].to_numpy(dtype=np.int64)[known_dp]
+    total = inventory_df["total_avails"].to_numpy(dtype=np.int64)[known_dp]
+    st = _category_codes(spots_df["station"], STATION_CODES)
+    status = _category_codes(spots_df["status"], SPOT_STATUSES)
+    counted = past & (st >= 0)
+    n_dp, n_st = len(DAYPART_CODES), len(STATION_CODES)
+    if use_kernel:
+        return _summary_counts_kernel(inv_dp, booked, total, st, status, counted, n_dp, n_st)
+
+    # One station x status table instead of a pass per status; the extra
+    # last column collects unknown (-1) statuses
+    n_status = len(SPOT_STATUSES) + 1
+    status_col = np.where(status[counted] < 0, n_status - 1, status[counted])
+    by_status = np.bincount(
+        st[counted].astype(np.intp) * n_status + status_col, minlength=n_st * n_status
+    ).reshape(n_st, n_status)
+    return (
+        np.bincount(inv_dp, weights=booked, minlength=n_dp).astype(np.int64),
+        np.bincount(inv_dp, weights=total, minlength=n_dp).astype(np.int64),
+        by_status[:, 2],
+        by_status[:, 1],
+        by_status.sum(axis=1),
+    )
+
+
 def print_summary(
     orders_df: pd.DataFrame,
     spots_df: pd.DataFrame,
@@ -686,24 +892,40 @@ def print_summary(
     print(f"  Spots:     {len(spots_df):>8,}")
     print(f"  Inventory: {len(inventory_df):>8,}")
 
-    total_revenue = spots_df["rate"].sum()
+    # Date masks, parsed once and shared by the makegood and YoY sections
+    air_date = spots_df["air_date"].to_numpy(dtype="datetime64[D]")
+    m_past = air_date <= np.datetime64(TODAY_CUTOFF)
+    m_q24 = (air_date >= np.datetime64("2024-01-01")) & (air_date <= np.datetime64("2024-03-31"))
+    m_q25 = (air_date >= np.datetime64("2025-01-01")) & (air_date <= np.datetime64("2025-03-31"))
+    dp_booked, dp_total, st_preempt, st_mg, st_spots = _summary_counts(inventory_df, spots_df, m_past)
+
+    # Distribution sections: one lazy query each, collected in a single pass
+    spots = pl.from_pandas(spots_df[["station", "daypart", "length", "status", "rate"]]).lazy()
+    totals, station_rev, dp_rev, length_counts, status_counts = pl.collect_all([
+        spots.select(pl.col("rate").sum()),
+        spots.group_by("station").agg(pl.col("rate").sum()).sort("rate", descending=True),
+        spots.group_by("daypart").agg(pl.col("rate").sum()).sort("rate", descending=True),
+        spots.group_by("length").agg(share=pl.len()).sort("length")
+        .with_columns(pl.col("share") / pl.col("share").sum()),
+        spots.group_by("status").agg(share=pl.len()).sort("share", descending=True)
+        .with_columns(pl.col("share") / pl.col("share").sum()),
+    ])
+    total_revenue = totals.item()
     print(f"\n  Total Revenue: ${total_revenue:>14,.2f}")
 
     # Revenue by station
     print(f"\n  {'-' * 50}")
     print(f"  REVENUE BY STATION")
     print(f"  {'-' * 50}")
-    station_rev = spots_df.groupby("station")["rate"].sum().sort_values(ascending=False)
-    for station, rev in station_rev.items():
+    for station, rev in station_rev.iter_rows():
         pct = rev / total_revenue * 100
-        print(f"    {station:<10} ${rev:>12,.2f}  ({pct:5.1f}%)")
+        print(f"    {station:<10} {_fmt_money(rev)}  ({pct:5.1f}%)")
 
     # Revenue by daypart
     print(f"\n  {'-' * 50}")
     print(f"  REVENUE BY DAYPART (vs Target)")
     print(f"  {'-' * 50}")
-    dp_rev = spots_df.groupby("daypart")["rate"].sum().sort_values(ascending=False)
-    for dp, rev in dp_rev.items():
+    for dp, rev in dp_rev.iter_rows():
         pct = rev / total_revenue * 100
         target = DAYPARTS[dp]["revenue_share"] * 100
         delta = pct - target
@@ -713,9 +935,8 @@ def print_summary(
     print(f"\n  {'-' * 50}")
     print(f"  SPOT LENGTH DISTRIBUTION (vs Target)")
     print(f"  {'-' * 50}")
-    length_counts = spots_df["length"].value_counts(normalize=True).sort_index()
     targets = {15: 0.20, 30: 0.70, 60: 0.10}
-    for length, pct in length_counts.items():
+    for length, pct in length_counts.iter_rows():
         target = targets.get(length, 0)
         print(f"    {length}s:  {pct*100:5.1f}%  (target: {target*100:.0f}%)")
 
@@ -723,54 +944,52 @@ def print_summary(
     print(f"\n  {'-' * 50}")
     print(f"  SPOT STATUS DISTRIBUTION")
     print(f"  {'-' * 50}")
-    status_counts = spots_df["status"].value_counts(normalize=True)
-    for status, pct in status_counts.items():
+    for status, pct in status_counts.iter_rows():
         print(f"    {status:<12} {pct*100:5.1f}%")
 
     # Advertiser concentration
     print(f"\n  {'-' * 50}")
     print(f"  ADVERTISER CONCENTRATION")
     print(f"  {'-' * 50}")
-    adv_rev = spots_df.groupby(
-        spots_df["order_id"].map(
-            dict(zip(orders_df["order_id"], orders_df["advertiser_name"]))
-        )
-    )["rate"].sum().sort_values(ascending=False)
-    top5_rev = adv_rev.head(5).sum()
-    top1_pct = adv_rev.iloc[0] / total_revenue * 100
-    top5_pct = top5_rev / total_revenue * 100
-    print(f"    Top advertiser:  {adv_rev.index[0]}")
+    # Key spots by advertiser category code instead of merging on order_id strings
+    order_pos = pd.Index(orders_df["order_id"]).get_indexer(spots_df["order_id"])
+    adv_names = orders_df["advertiser_name"].astype("category")
+    spot_adv = pd.Categorical.from_codes(
+        np.where(order_pos >= 0, adv_names.cat.codes.to_numpy()[order_pos], -1),
+        categories=adv_names.cat.categories,
+    )
+    # One unsorted aggregation; only the top 5 are ranked
+    adv_rev = spots_df["rate"].groupby(spot_adv, observed=True, sort=False).sum()
+    top5 = adv_rev.nlargest(5)
+    top1_pct = top5.iloc[0] / total_revenue * 100
+    top5_pct = top5.sum() / total_revenue * 100
+    print(f"    Top advertiser:  {top5.index[0]}")
     print(f"      Revenue share: {top1_pct:.1f}%  (target: ~13%, threshold: 15%)")
     print(f"    Top 5 combined:  {top5_pct:.1f}%  (target: ~45%)")
-    print(f"    Total advertisers: {adv_rev.nunique()}")
+    print(f"    Total advertisers: {len(adv_rev)}")
 
     # Sell-out rates by daypart
     print(f"\n  {'-' * 50}")
     print(f"  SELL-OUT RATES BY DAYPART (vs Target)")
     print(f"  {'-' * 50}")
-    inv_agg = inventory_df.groupby("daypart").agg(
-        total=("total_avails", "sum"),
-        booked=("booked", "sum"),
-    )
-    inv_agg["sellout"] = inv_agg["booked"] / inv_agg["total"]
-    for dp in ["PR", "EN", "PA", "LN", "EM", "EF", "DT", "LF"]:
-        if dp in inv_agg.index:
-            so = inv_agg.loc[dp, "sellout"] * 100
-            target = SELLOUT_TARGETS[dp] * 100
-            flag = " !! PRICING FLAG" if so >= 85 else ""
-            print(f"    {dp} ({DAYPARTS[dp]['name']:<16}) {so:5.1f}%  (target: {target:.0f}%){flag}")
+    for dp, i, name, target in _SELLOUT_REPORT_ROWS:
+        if not dp_total[i]:
+            continue
+        so = dp_booked[i] / dp_total[i] * 100
+        flag = " !! PRICING FLAG" if so >= 85 else ""
+        print(f"    {dp} ({name:<16}) {so:5.1f}%  (target: {target:.0f}%){flag}")
 
     # Makegood rates by station
     print(f"\n  {'-' * 50}")
     print(f"  MAKEGOOD + PREEMPTION RATES BY STATION")
     print(f"  {'-' * 50}")
-    past_spots = spots_df[spots_df["air_date"] <= TODAY_CUTOFF.isoformat()]
-    for station in STATIONS:
-        st_spots = past_spots[past_spots["station"] == station]
-        if len(st_spots) == 0:
+    # Tallies are already aligned to STATION_CODES; compute every rate at once
+    has_spots = st_spots > 0
+    preempt_rates = np.divide(st_preempt, st_spots, out=np.zeros(len(st_spots)), where=has_spots) * 100
+    mg_rates = np.divide(st_mg, st_spots, out=np.zeros(len(st_spots)), where=has_spots) * 100
+    for station, present, preempt_pct, mg_pct in zip(STATION_CODES, has_spots, preempt_rates, mg_rates):
+        if not present:
             continue
-        preempt_pct = (st_spots["status"] == "preempted").mean() * 100
-        mg_pct = (st_spots["status"] == "makegood").mean() * 100
         combined = preempt_pct + mg_pct
         flag = " !! ABOVE 5% THRESHOLD" if combined > 5 else ""
         print(f"    {station:<10} preempted: {preempt_pct:4.1f}%  makegood: {mg_pct:4.1f}%  combined: {combined:4.1f}%{flag}")
@@ -779,32 +998,75 @@ def print_summary(
     print(f"\n  {'-' * 50}")
     print(f"  YoY Q1 COMPARISON (Jan-Mar 2024 vs 2025)")
     print(f"  {'-' * 50}")
-    q1_2024 = spots_df[
-        (spots_df["air_date"] >= "2024-01-01") & (spots_df["air_date"] <= "2024-03-31")
-    ]
-    q1_2025 = spots_df[
-        (spots_df["air_date"] >= "2025-01-01") & (spots_df["air_date"] <= "2025-03-31")
-    ]
-    rev_2024 = q1_2024["rate"].sum()
-    rev_2025 = q1_2025["rate"].sum()
+    # One sum and a mask count per quarter; AUR is derived, not re-scanned
+    rate = spots_df["rate"].to_numpy(dtype=np.float64, copy=False)
+    q1_totals = []
+    for m in (m_q24, m_q25):
+        q_rev, n = rate[m].sum(), np.count_nonzero(m)
+        q1_totals.append((q_rev, q_rev / n if n else np.nan))
+    (rev_2024, aur_2024), (rev_2025, aur_2025) = q1_totals
     if rev_2024 > 0:
         yoy_change = (rev_2025 - rev_2024) / rev_2024 * 100
-        print(f"    Q1 2024 revenue: ${rev_2024:>12,.2f}")
-        print(f"    Q1 2025 revenue: ${rev_2025:>12,.2f}")
-        print(f"    YoY change:      {yoy_change:>+11.1f}%")
-    aur_2024 = q1_2024["rate"].mean()
-    aur_2025 = q1_2025["rate"].mean()
+        print(f"    Q1 2024 revenue: {_fmt_money(rev_2024)}")
+        print(f"    Q1 2025 revenue: {_fmt_money(rev_2025)}")
+        print(f"    YoY change:      {_fmt_change(yoy_change)}")
     if aur_2024 > 0:
         aur_change = (aur_2025 - aur_2024) / aur_2024 * 100
-        print(f"    Q1 2024 AUR:     ${aur_2024:>12,.2f}")
-        print(f"    Q1 2025 AUR:     ${aur_2025:>12,.2f}")
-        print(f"    AUR change:      {aur_change:>+11.1f}%")
+        print(f"    Q1 2024 AUR:     {_fmt_money(aur_2024)}")
+        print(f"    Q1 2025 AUR:     {_fmt_money(aur_2025)}")
+        print(f"    AUR change:      {_fmt_change(aur_change)}")
 
     print("\n" + "=" * 70)
     print("  GENERATION COMPLETE")
     print("=" * 70 + "\n")
 
 
+# ── Random Streams ───────────────────────────────────────────────────────────
+
+GENERATION_PHASES = ("advertisers", "orders", "spots", "inventory")
+
+
+def phase_rngs(seed: int) -> Dict[str, np.random.Generator]:
+    """One independent Generator per generation phase, spawned from ``seed``.
+
+    Each phase's stream depends only on the seed, not on how many draws
+    earlier phases made, so phases can change (or run in parallel)
+    without perturbing each other's output.
+    """
+    children = np.random.SeedSequence(seed).spawn(len(GENERATION_PHASES))
+    return {phase: np.random.default_rng(ss) for phase, ss in zip(GENERATION_PHASES, children)}
+
+
+# ── Output ────────────────────────────────────────────────────────────────────
+
+def write_csv(df: pd.DataFrame, path: Path) -> None:
+    """Write a DataFrame to CSV with Arrow's multi-threaded writer."""
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+
+
+# ISO string columns stored with their wo_fields.yaml types in Parquet
+_PARQUET_DATE_COLUMNS = {"order_date", "start_date", "end_date", "air_date", "date"}
+_PARQUET_TIME_COLUMNS = {"air_time"}
+
+
+def write_parquet(df: pd.DataFrame, path: Path) -> None:
+    """Write a DataFrame to Snappy Parquet with typed date/time columns.
+
+    Categorical columns are stored dictionary-encoded.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for i, name in enumerate(table.column_names):
+        if name in _PARQUET_DATE_COLUMNS:
+            table = table.set_column(i, name, table[name].cast(pa.date32()))
+        elif name in _PARQUET_TIME_COLUMNS:
+            times = pc.strptime(table[name], format="%H:%M:%S", unit="s").cast(pa.time32("s"))
+            table = table.set_column(i, name, times)
+    pq.write_table(table, path, compression="snappy")
+
+
+OUTPUT_WRITERS = {"csv": write_csv, "parquet": write_parquet}
+
+
 # ── Main ──────────────────────────────────────────────────────────────────────
 
 def main():
@@ -823,9 +1085,25 @@ def main():
         default=42,
         help="Random seed for reproducibility (default: 42)",
     )
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Skip referential integrity checks (faster bulk generation)",
+    )
+    parser.add_argument(
+        "--no-summary",
+        action="store_true",
+        help="Skip the distribution summary (e.g. CI data regeneration)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["csv", "parquet", "both"],
+        default="csv",
+        help="Output file format (default: csv)",
+    )
     args = parser.parse_args()
 
-    rng = np.random.default_rng(args.seed)
+    rngs = phase_rngs(args.seed)
     output_dir = args.output_dir
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -837,17 +1115,17 @@ def main():
     logger.info("=" * 60)
 
     # Step 1: Setup
-    advertisers = generate_advertisers(rng)
+    advertisers = generate_advertisers(rngs["advertisers"])
     agencies = generate_agencies()
     logger.info(f"Configured {len(advertisers)} advertisers, {len(agencies)} agencies")
 
     # Step 2: Generate orders
     logger.info("Generating orders...")
-    orders_df = generate_orders(advertisers, agencies, rng)
+    orders_df = generate_orders(advertisers, agencies, rngs["orders"])
 
     # Step 3: Generate spots
     logger.info("Generating spots...")
-    spots_df = generate_spots(orders_df, advertisers, rng)
+    spots_df = generate_spots(orders_df, advertisers, rngs["spots"])
 
     # Step 4: Backfill order totals
     logger.info("Updating order totals from spot sums...")
@@ -855,27 +1133,41 @@ def main():
 
     # Step 5: Generate inventory
     logger.info("Generating inventory...")
-    inventory_df = generate_inventory(spots_df, rng)
+    inventory_df = generate_inventory(spots_df, rngs["inventory"])
 
     # Step 6: Validate
-    logger.info("Validating data integrity...")
-    valid = validate_all(orders_df, spots_df, inventory_df)
-
-    # Step 7: Write CSVs
-    orders_path = output_dir / "orders.csv"
-    spots_path = output_dir / "spots.csv"
-    inventory_path = output_dir / "inventory.csv"
+    if args.no_validate:
+        logger.info("Skipping validation (--no-validate)")
+        valid = True
+    else:
+        logger.info("Validating data integrity...")
+        valid = validate_all(orders_df, spots_df, inventory_df)
+
+    # Step 7: Write outputs
+    formats = ["csv", "parquet"] if args.format == "both" else [args.format]
+    frames = {
+        "orders": orders_df.drop(columns=["start_ord", "end_ord"]),
+        "spots": spots_df,
+        "inventory": inventory_df,
+    }
+    outputs = [
+        (OUTPUT_WRITERS[fmt], df, output_dir / f"{name}.{fmt}")
+        for fmt in formats
+        for name, df in frames.items()
+    ]
 
-    orders_df.to_csv(orders_path, index=False)
-    spots_df.to_csv(spots_path, index=False)
-    inventory_df.to_csv(inventory_path, index=False)
+    # Arrow's writers release the GIL, so the files are written concurrently
+    with ThreadPoolExecutor(max_workers=len(outputs)) as pool:
+        list(pool.map(lambda job: job[0](job[1], job[2]), outputs))
 
-    logger.info(f"Wrote {orders_path} ({len(orders_df)} rows)")
-    logger.info(f"Wrote {spots_path} ({len(spots_df)} rows)")
-    logger.info(f"Wrote {inventory_path} ({len(inventory_df)} rows)")
+    for _, df, path in outputs:
+        logger.info(f"Wrote {path} ({len(df)} rows)")
 
     # Step 8: Print summary
-    print_summary(orders_df, spots_df, inventory_df)
+    if args.no_summary:
+        logger.info("Skipping summary (--no-summary)")
+    else:
+        print_summary(orders_df, spots_df, inventory_df)
 
     if not valid:
         logger.error("Data validation failed — check errors above")
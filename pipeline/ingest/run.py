@@ -2,7 +2,9 @@
 Data Ingestion Pipeline — WideOrbit WO Traffic
 
 Reads raw WO exports from data/raw/ and writes to data/processed/.
-Handles: CSV parsing, type casting, null handling, deduplication.
+Handles: CSV/Parquet parsing, type casting, null handling, validation,
+deduplication.
+A table's Parquet export is preferred over its CSV when both are present.
 
 Usage:
     python pipeline/ingest/run.py
@@ -11,8 +13,19 @@ Usage:
 
 import argparse
 import logging
+import operator
+import os
 import sys
+from functools import reduce
 from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import yaml
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
@@ -20,6 +33,175 @@ sys.path.insert(0, str(PROJECT_ROOT))
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(name)s] %(message)s")
 logger = logging.getLogger("ingest")
 
+SCHEMA_PATH = PROJECT_ROOT / "data" / "schemas" / "wo_fields.yaml"
+
+# Arrow type for each wo_fields.yaml field type
+ARROW_TYPES = {
+    "string": pa.string(),
+    "date": pa.date32(),
+    "time": pa.time32("s"),
+    "decimal": pa.float64(),
+    "integer": pa.int64(),
+}
+
+
+# Row-level invariants of the WO tables beyond what wo_fields.yaml declares;
+# each predicate selects the offending rows
+ROW_INVARIANTS = {
+    "orders": [
+        ("orders end before their flight starts", ds.field("end_date") < ds.field("start_date")),
+    ],
+    "inventory": [
+        ("inventory rows have negative remaining", ds.field("remaining") < 0),
+        (
+            "inventory rows: remaining != total_avails - booked",
+            ds.field("remaining") != ds.field("total_avails") - ds.field("booked"),
+        ),
+    ],
+}
+
+
+def load_spec(path: Path = SCHEMA_PATH) -> dict:
+    """Load wo_fields.yaml as-is (table definitions and lookup sections)."""
+    with open(path) as f:
+        return yaml.safe_load(f)
+
+
+def table_definitions(spec: dict) -> Dict[str, dict]:
+    """The table definitions (entries with a ``fields`` list) in a loaded spec."""
+    return {name: table for name, table in spec.items() if "fields" in table}
+
+
+def load_schema(path: Path = SCHEMA_PATH) -> Dict[str, dict]:
+    """Load the table definitions from wo_fields.yaml."""
+    return table_definitions(load_spec(path))
+
+
+def daypart_codes(spec: dict) -> List[str]:
+    """Daypart codes declared under ``daypart_mapping`` in a loaded spec."""
+    return sorted(spec.get("daypart_mapping", {}).get("codes", {}))
+
+
+def compile_checks(
+    schema: Dict[str, dict], dayparts: List[str]
+) -> Dict[str, List[Tuple[str, ds.Expression]]]:
+    """Violation predicates per table, specialized from wo_fields.yaml once per run.
+
+    Adds a ``dayparts`` code check to every table with a daypart column, on
+    top of ROW_INVARIANTS. The expressions are evaluated by Arrow; nothing
+    walks the schema per row.
+    """
+    allowed = pa.array(dayparts, pa.string())
+    checks = {}
+    for name, table in schema.items():
+        table_checks = list(ROW_INVARIANTS.get(name, []))
+        if len(allowed) and any(field["name"] == "daypart" for field in table["fields"]):
+            daypart = ds.field("daypart")
+            table_checks.append((
+                f"{name} rows have a daypart not in daypart_mapping",
+                daypart.is_valid() & ~daypart.isin(allowed),
+            ))
+        checks[name] = table_checks
+    return checks
+
+
+def validate_table(table: pa.Table, checks: List[Tuple[str, ds.Expression]]) -> List[str]:
+    """Error lines for each check that matches at least one row."""
+    dataset = ds.dataset(table)
+    errors = []
+    for message, violation in checks:
+        count = dataset.count_rows(filter=violation)
+        if count:
+            errors.append(f"  {count} {message}")
+    return errors
+
+
+def convert_options(fields: List[dict]) -> pacsv.ConvertOptions:
+    """Arrow CSV ConvertOptions declaring every schema column's type up front."""
+    return pacsv.ConvertOptions(
+        column_types={field["name"]: ARROW_TYPES[field["type"]] for field in fields},
+        strings_can_be_null=True,
+    )
+
+
+def arrow_schema(fields: List[dict]) -> pa.Schema:
+    """Arrow schema for a table definition, in field order."""
+    return pa.schema([(field["name"], ARROW_TYPES[field["type"]]) for field in fields])
+
+
+def required_filter(fields: List[dict]) -> ds.Expression:
+    """Predicate keeping rows where every non-nullable schema field is present."""
+    checks = [ds.field(field["name"]).is_valid() for field in fields if not field.get("nullable")]
+    return reduce(operator.and_, checks, ds.scalar(True))
+
+
+def read_table(path: Path, fields: List[dict]) -> pa.Table:
+    """Read one WO export (CSV or Parquet) with the schema's column types.
+
+    Scans through ``pyarrow.dataset`` so only schema columns are materialized and
+    rows missing a required field are dropped batch by batch. Raises ValueError
+    if the file lacks a non-nullable schema column; missing nullable columns
+    are read as nulls.
+    """
+    if path.suffix == ".parquet":
+        file_format = ds.ParquetFileFormat()
+    else:
+        file_format = ds.CsvFileFormat(convert_options=convert_options(fields))
+
+    present = set(ds.dataset(path, format=file_format).schema.names)
+    missing = [f["name"] for f in fields if not f.get("nullable") and f["name"] not in present]
+    if missing:
+        raise ValueError(f"{path.name} is missing required columns: {', '.join(missing)}")
+
+    schema = arrow_schema(fields)
+    dataset = ds.dataset(path, format=file_format, schema=schema)
+    keep = required_filter(fields)
+    n_scanned, batches = 0, []
+    for batch in dataset.to_batches(columns=schema.names):
+        n_scanned += batch.num_rows
+        batches.append(batch.filter(keep))
+    table = pa.Table.from_batches(batches, schema=schema)
+    logger.info(
+        f"  Read {path.name}: {table.num_rows:,} rows "
+        f"({n_scanned - table.num_rows:,} dropped for missing required fields)"
+    )
+    return table
+
+
+def deduplicate(table: pa.Table, key: List[str]) -> pa.Table:
+    """Keep the first row for each ``key`` value, preserving file order."""
+    if not key:
+        return table
+    first_rows = (
+        table.select(key)
+        .append_column("_row", pa.array(range(table.num_rows), pa.int64()))
+        .group_by(key, use_threads=False)
+        .aggregate([("_row", "min")])
+        .column("_row_min")
+    )
+    if len(first_rows) == table.num_rows:
+        return table
+    return table.take(first_rows.take(pc.sort_indices(first_rows)))
+
+
+def list_exports(source_dir: Path) -> List[os.DirEntry]:
+    """Export files in ``source_dir`` from one directory scan, one per table.
+
+    A table's typed Parquet export is preferred; its CSV is used only when
+    that table has no Parquet file. Entries keep their cached stat data for
+    size logging.
+    """
+    by_table: Dict[str, Dict[str, os.DirEntry]] = {}
+    with os.scandir(source_dir) as it:
+        for entry in it:
+            path = Path(entry.name)
+            if path.suffix in (".parquet", ".csv") and entry.is_file():
+                by_table.setdefault(path.stem, {})[path.suffix] = entry
+    return [
+        files.get(".parquet") or files[".csv"]
+        for _, files in sorted(by_table.items())
+    ]
+
 
 def ingest(source_dir: Path, output_dir: Path):
     """Ingest WO data exports from source to processed output."""
@@ -27,26 +209,55 @@ def ingest(source_dir: Path, output_dir: Path):
         logger.error(f"Source directory does not exist: {source_dir}")
         return False
 
-    csv_files = list(source_dir.glob("*.csv"))
-    if not csv_files:
-        logger.warning(f"No CSV files found in {source_dir}")
+    # Prefer each table's typed Parquet export; fall back to re-parsing its CSV
+    entries = list_exports(source_dir)
+    if not entries:
+        logger.warning(f"No CSV or Parquet files found in {source_dir}")
         return False
 
-    logger.info(f"Found {len(csv_files)} files to ingest:")
-    for f in csv_files:
-        logger.info(f"  - {f.name} ({f.stat().st_size / 1024:.1f} KB)")
+    logger.info(f"Found {len(entries)} files to ingest:")
+    for entry in entries:
+        logger.info(f"  - {entry.name} ({entry.stat().st_size / 1024:.1f} KB)")
+    export_files = [Path(entry.path) for entry in entries]
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # TODO: Implement ingestion logic
-    # 1. Read each CSV with pandas/polars
-    # 2. Validate against expected schema (data/schemas/)
-    # 3. Cast types, handle nulls
-    # 4. Deduplicate records
-    # 5. Write to data/processed/
+    # Read each export with types cast from the schema (no dtype inference)
+    spec = load_spec()
+    schema = table_definitions(spec)
+    checks = compile_checks(schema, daypart_codes(spec))
+    tables = {}
+    for f in export_files:
+        table_spec = schema.get(f.stem)
+        if table_spec is None:
+            logger.warning(f"  Skipping {f.name}: no table definition in {SCHEMA_PATH.name}")
+            continue
+        try:
+            tables[f.stem] = read_table(f, table_spec["fields"])
+        except ValueError as e:
+            logger.error(f"  {e}")
+            return False
+
+    errors = [e for name, table in tables.items() for e in validate_table(table, checks[name])]
+    if errors:
+        logger.error("VALIDATION FAILED:")
+        for e in errors:
+            logger.error(e)
+        return False
+
+    # Deduplicate on each table's key from wo_fields.yaml
+    for name, table in tables.items():
+        deduped = deduplicate(table, schema[name].get("key", []))
+        if deduped.num_rows < table.num_rows:
+            logger.info(f"  Removed {table.num_rows - deduped.num_rows:,} duplicate {name} rows")
+        tables[name] = deduped
+
+    for name, table in tables.items():
+        out_path = output_dir / f"{name}.parquet"
+        pq.write_table(table, out_path, compression="zstd")
+        logger.info(f"  Wrote {out_path.name}: {table.num_rows:,} rows")
 
-    logger.info("Ingestion pipeline — not yet implemented")
-    logger.info("Next step: Get sample data or WO export schema to build parser")
+    logger.info("Ingest done")
     return True
 
 
@@ -0,0 +1,80 @@
+"""Tests for the backend DataLoader and /api/data aggregations."""
+
+import asyncio
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "backend"))
+
+from services.data_loader import DataLoader, DAYPART_ORDER  # noqa: E402
+import routes.data as data_routes  # noqa: E402
+
+SAMPLE_DIR = PROJECT_ROOT / "data" / "sample"
+
+
+@pytest.fixture
+def loader(tmp_path):
+    """DataLoader over a scratch copy of the sample CSVs."""
+    for name in ("orders.csv", "spots.csv", "inventory.csv"):
+        shutil.copy(SAMPLE_DIR / name, tmp_path / name)
+    loader = DataLoader(tmp_path)
+    data_routes.init_loader(loader)
+    return loader
+
+
+def test_revenue_by_daypart_matches_pandas(loader):
+    """Revenue totals agree with a plain pandas computation."""
+    result = asyncio.run(data_routes.revenue_by_daypart(station="KHQ-TV"))
+    assert [d["daypart"] for d in result["dayparts"]] == DAYPART_ORDER
+
+    spots = loader.spots
+    cutoff = data_routes._ytd_cutoff(spots)
+    rev = spots[
+        spots["status"].isin(data_routes.REVENUE_STATUSES)
+        & (spots["station"] == "KHQ-TV")
+        & (spots["air_date"].dt.year == data_routes.CY_YEAR)
+        & (spots["air_date"].dt.dayofyear <= cutoff)
+    ]
+    assert result["total_cy"] == round(float(rev["rate"].sum()), 2)
+
+
+def test_endpoint_results_are_memoized(loader):
+    """Repeat queries hit the cache; re-initializing the loader clears it."""
+    first = asyncio.run(data_routes.sellout_rates(station=None))
+    assert asyncio.run(data_routes.sellout_rates(station=None)) is first
+    data_routes.init_loader(loader)
+    assert asyncio.run(data_routes.sellout_rates(station=None)) is not first
+
+
+def test_sellout_rates_match_pandas(loader, tmp_path):
+    """bincount-based sell-out rates agree with a pandas groupby."""
+    # A daypart outside DAYPART_ORDER becomes an extra category (code >= 8)
+    # and must not leak into the reported dayparts
+    with open(tmp_path / "inventory.csv", "a") as f:
+        f.write("2025-01-02,XX,KULR-TV,50,50,0\n")
+    result = asyncio.run(data_routes.sellout_rates(station="KULR-TV"))
+    assert [d["daypart"] for d in result["dayparts"]] == DAYPART_ORDER
+
+    inv = loader.inventory
+    cutoff = data_routes._ytd_cutoff(loader.spots)
+    cy = inv[
+        (inv["station"] == "KULR-TV")
+        & (inv["year"] == data_routes.CY_YEAR)
+        & (inv["doy"] <= cutoff)
+    ]
+    by_dp = cy.groupby("daypart", observed=True)[["booked", "total_avails"]].sum()
+    for row in result["dayparts"]:
+        booked, avails = by_dp.loc[row["daypart"]]
+        assert row["cy_rate"] == round(booked / avails * 100, 1)
+
+
+def test_daypart_codes_follow_daypart_order(loader):
+    """SoA daypart codes index DAYPART_ORDER regardless of CSV row order."""
+    spots = loader.spots
+    codes = loader.spot_arrays.daypart
+    assert list(spots["daypart"].cat.categories[: len(DAYPART_ORDER)]) == DAYPART_ORDER
+    assert [DAYPART_ORDER[c] for c in codes[:50]] == spots["daypart"].head(50).tolist()
@@ -1,18 +1,107 @@
 """Tests for the data ingestion and normalization pipeline."""
 
+import os
+import sys
 from pathlib import Path
 
+import pyarrow as pa
+import pyarrow.parquet as pq
+
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from pipeline.ingest import run as ingest_run  # noqa: E402
 
 
 def test_data_directories_exist():
     """Verify required data directories are present."""
-    assert (PROJECT_ROOT / "data" / "raw").exists()
-    assert (PROJECT_ROOT / "data" / "sample").exists()
-    assert (PROJECT_ROOT / "data" / "processed").exists()
-    assert (PROJECT_ROOT / "data" / "schemas").exists()
+    with os.scandir(PROJECT_ROOT / "data") as it:
+        entries = {entry.name for entry in it if entry.is_dir()}
+    assert {"raw", "sample", "processed", "schemas"} <= entries
 
 
 def test_schema_file_exists():
     """Verify WO field schema is defined."""
-    assert (PROJECT_ROOT / "data" / "schemas" / "wo_fields.yaml").exists()
+    assert (PROJECT_ROOT / "data" / "schemas" / "wo_fields.yaml").is_file()
+
+
+def test_ingest_reads_columns_with_schema_types():
+    """CSV columns are parsed with the types declared in wo_fields.yaml."""
+    fields = ingest_run.load_schema()["spots"]["fields"]
+    table = ingest_run.read_table(PROJECT_ROOT / "data" / "sample" / "spots.csv", fields)
+    assert table.schema.field("air_date").type == pa.date32()
+    assert table.schema.field("air_time").type == pa.time32("s")
+    assert table.schema.field("length").type == pa.int64()
+
+
+def test_ingest_casts_parquet_to_schema_types(tmp_path):
+    """Parquet exports are cast to the same types as the CSV reader produces."""
+    fields = ingest_run.load_schema()["inventory"]["fields"]
+    from_csv = ingest_run.read_table(PROJECT_ROOT / "data" / "sample" / "inventory.csv", fields)
+    encoded = from_csv.set_column(1, "daypart", from_csv["daypart"].dictionary_encode())
+    pq.write_table(encoded, tmp_path / "inventory.parquet")
+    assert ingest_run.read_table(tmp_path / "inventory.parquet", fields).equals(from_csv)
+
+
+def test_ingest_drops_rows_missing_required_fields_and_writes_parquet(tmp_path):
+    """Rows with an empty non-nullable field are filtered out before output."""
+    source, output = tmp_path / "raw", tmp_path / "processed"
+    source.mkdir()
+    lines = (PROJECT_ROOT / "data" / "sample" / "orders.csv").read_text().splitlines()
+    header, first, second = lines[:3]
+    blanked = second.split(",")
+    blanked[0] = ""  # order_id is required
+    (source / "orders.csv").write_text("\n".join([header, first, ",".join(blanked)]) + "\n")
+
+    assert ingest_run.ingest(source, output)
+    written = pq.read_table(output / "orders.parquet")
+    assert written.num_rows == 1
+    assert written.schema.names == [f["name"] for f in ingest_run.load_schema()["orders"]["fields"]]
+
+
+def test_ingest_rejects_unknown_daypart_codes(tmp_path):
+    """Compiled schema checks fail the run before anything is written."""
+    source, output = tmp_path / "raw", tmp_path / "processed"
+    source.mkdir()
+    lines = (PROJECT_ROOT / "data" / "sample" / "inventory.csv").read_text().splitlines()
+    bad = lines[1].split(",")
+    bad[1] = "ZZ"  # daypart
+    (source / "inventory.csv").write_text("\n".join([lines[0], lines[2], ",".join(bad)]) + "\n")
+
+    assert not ingest_run.ingest(source, output)
+    assert not (output / "inventory.parquet").exists()
+
+
+def test_list_exports_picks_format_per_table(tmp_path):
+    """A Parquet export for one table does not hide the other tables' CSVs."""
+    for name in ("orders.parquet", "orders.csv", "spots.csv", "inventory.csv", "notes.txt"):
+        (tmp_path / name).write_text("")
+    names = sorted(entry.name for entry in ingest_run.list_exports(tmp_path))
+    assert names == ["inventory.csv", "orders.parquet", "spots.csv"]
+
+
+def test_ingest_fails_when_required_column_is_missing(tmp_path):
+    """An export without a non-nullable column fails instead of reading as all-null."""
+    source, output = tmp_path / "raw", tmp_path / "processed"
+    source.mkdir()
+    lines = (PROJECT_ROOT / "data" / "sample" / "orders.csv").read_text().splitlines()[:3]
+    # Drop the trailing station column
+    (source / "orders.csv").write_text("\n".join(line.rsplit(",", 1)[0] for line in lines) + "\n")
+
+    assert not ingest_run.ingest(source, output)
+    assert not (output / "orders.parquet").exists()
+
+
+def test_ingest_deduplicates_on_table_key(tmp_path):
+    """Repeated spot_ids keep their first row, in file order."""
+    source, output = tmp_path / "raw", tmp_path / "processed"
+    source.mkdir()
+    lines = (PROJECT_ROOT / "data" / "sample" / "spots.csv").read_text().splitlines()
+    header, first, second = lines[:3]
+    repeat = first.replace(",aired,", ",makegood,")
+    (source / "spots.csv").write_text("\n".join([header, first, repeat, second]) + "\n")
+
+    assert ingest_run.ingest(source, output)
+    written = pq.read_table(output / "spots.parquet")
+    assert written.column("spot_id").to_pylist() == [first.split(",")[0], second.split(",")[0]]
+    assert written.column("status")[0].as_py() == "aired"
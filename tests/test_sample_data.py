@@ -0,0 +1,116 @@
+"""Tests for the WideOrbit sample data generator."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+GENERATOR_PATH = PROJECT_ROOT / "data" / "sample" / "generate_sample_data.py"
+
+_spec = importlib.util.spec_from_file_location("generate_sample_data", GENERATOR_PATH)
+gen = importlib.util.module_from_spec(_spec)
+# Registered under its real name so numba's on-disk cache (cache=True kernels)
+# records "generate_sample_data" rather than "<dynamic>"
+sys.modules[_spec.name] = gen
+_spec.loader.exec_module(gen)
+
+
+def _generate(seed: int = 42):
+    rngs = gen.phase_rngs(seed)
+    advertisers = gen.generate_advertisers(rngs["advertisers"])
+    orders_df = gen.generate_orders(advertisers, gen.generate_agencies(), rngs["orders"])
+    spots_df = gen.generate_spots(orders_df, advertisers, rngs["spots"])
+    orders_df = gen.update_order_totals(orders_df, spots_df)
+    inventory_df = gen.generate_inventory(spots_df, rngs["inventory"])
+    return orders_df, spots_df, inventory_df
+
+
+@pytest.fixture(scope="module")
+def generated():
+    return _generate()
+
+
+def test_generated_data_passes_validation(generated):
+    """Referential integrity and inventory checks hold for the default seed."""
+    assert gen.validate_all(*generated)
+
+
+def test_generation_is_deterministic_for_seed(generated):
+    """Same seed reproduces identical spots."""
+    _, spots_df, _ = generated
+    _, spots_again, _ = _generate()
+    assert spots_df.equals(spots_again)
+
+
+def test_validation_flags_broken_references(generated):
+    """A spot pointing at a missing order fails validation."""
+    orders_df, spots_df, inventory_df = generated
+    broken = spots_df.copy()
+    broken.loc[0, "order_id"] = "WO-99999"
+    assert not gen.validate_all(orders_df, broken, inventory_df)
+
+
+def test_validation_reports_null_order_station_as_mismatch(generated, caplog):
+    """An order that exists but has no station is a mismatch, not a broken ref."""
+    orders_df, spots_df, inventory_df = generated
+    broken = orders_df.copy()
+    broken["station"] = broken["station"].astype(object)
+    broken.loc[0, "station"] = None
+    assert not gen.validate_all(broken, spots_df, inventory_df)
+    assert "station mismatch" in caplog.text
+    assert "invalid order_ids" not in caplog.text
+
+
+def test_rate_status_kernel_matches_numpy_path():
+    """Fused kernel (numba or plain Python) agrees with the NumPy path."""
+    draw = np.random.default_rng(0)
+    n = 2000
+    station_idx = draw.integers(0, len(gen.STATION_CODES), size=n)
+    dp_idx = draw.integers(0, len(gen.DAYPART_CODES), size=n)
+    length_idx = draw.integers(0, len(gen.SPOT_LENGTHS), size=n)
+    air_dates = np.datetime64(gen.DATE_START) + draw.integers(0, 455, size=n)
+
+    results = [
+        gen._spot_rates_and_statuses(
+            station_idx, dp_idx, length_idx, air_dates, "KHQ-TV",
+            np.random.default_rng(7), use_kernel=use_kernel,
+        )
+        for use_kernel in (False, True)
+    ]
+    (rates_np, codes_np), (rates_k, codes_k) = results
+    np.testing.assert_array_equal(rates_np, rates_k)
+    np.testing.assert_array_equal(codes_np, codes_k)
+
+
+def test_summary_counts_kernel_matches_bincount(generated):
+    """Fused summary kernel (numba or plain Python) agrees with np.bincount."""
+    _, spots_df, inventory_df = generated
+    # Codes outside the known categories (-1) must be handled the same way
+    inventory_df = inventory_df.astype({"daypart": object})
+    inventory_df.loc[0, "daypart"] = "XX"
+    spots_df = spots_df.astype({"station": object, "status": object})
+    spots_df.loc[0, "station"] = "KXXX-TV"
+    spots_df.loc[1, "status"] = "bumped"
+    past = spots_df["air_date"].to_numpy(dtype="datetime64[D]") <= np.datetime64(gen.TODAY_CUTOFF)
+    counts_np, counts_k = (
+        gen._summary_counts(inventory_df, spots_df, past, use_kernel=use_kernel)
+        for use_kernel in (False, True)
+    )
+    for a, b in zip(counts_np, counts_k):
+        np.testing.assert_array_equal(a, b)
+    booked, _, _, _, st_spots = counts_np
+    assert booked.sum() == inventory_df["booked"].iloc[1:].sum()
+    assert st_spots.sum() == past[1:].sum()
+
+
+def test_print_summary_reports_every_station(generated, capsys):
+    """Summary prints each section and a makegood line per station."""
+    gen.print_summary(*generated)
+    out = capsys.readouterr().out
+    assert "SELL-OUT RATES BY DAYPART" in out
+    assert "YoY Q1 COMPARISON" in out
+    for station in gen.STATIONS:
+        assert f"    {station:<10} preempted:" in out